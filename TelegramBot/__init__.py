@@ -1,9 +1,8 @@
 import sys
 import time
-import uvloop
 from pyrogram import Client
 from telegraph.aio import Telegraph
-from asyncio import get_event_loop, new_event_loop, set_event_loop
+from asyncio import get_event_loop, new_event_loop, set_event_loop, set_event_loop_policy
 
 from TelegramBot import config
 from TelegramBot.logging import LOGGER
@@ -18,7 +17,14 @@ from TelegramBot.database.MongoDb import check_mongo_uri
 #)
 
 
-uvloop.install()
+# uvloop must be the loop policy before the event loop below is created;
+# it is not available on Windows, where the default loop is used
+try:
+    import uvloop
+    set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
 LOGGER(__name__).info("Starting TelegramBot....")
 BotStartTime = time.time()
 
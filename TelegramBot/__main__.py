@@ -1,8 +1,10 @@
-import asyncio
+from pyrogram import idle
 from TelegramBot import bot
 from TelegramBot.logging import LOGGER
 from TelegramBot import config
 from TelegramBot.helpers.pinger import BackgroundPinger
+from TelegramBot.helpers.async_pinger import close_shared_pingers
+from TelegramBot.plugins.sudo.config import flush_config_save
 
 LOGGER(__name__).info("client successfully initiated....")
 
@@ -13,11 +15,22 @@ pinger = BackgroundPinger(
 )
 
 
-# 
-if __name__ == "__main__":
-    # Create a background task for the pinger
-    bot.loop.create_task(pinger.start())
-    
-    
+async def main():
     # Start the bot (this will handle messages and commands)
-    bot.run()
\ No newline at end of file
+    await bot.start()
+    config.config_manager.start_auto_reload()
+    await pinger.start()
+    
+    # Block until the bot receives a shutdown signal, then let the
+    # pinger exit cleanly before the client disconnects
+    await idle()
+    await pinger.stop()
+    await close_shared_pingers()
+    config.config_manager.stop_auto_reload()
+    # Don't lose config edits still waiting out the save debounce
+    await flush_config_save()
+    await bot.stop()
+
+
+if __name__ == "__main__":
+    bot.run(main())
\ No newline at end of file
@@ -1,29 +1,27 @@
-import json
 import os
+import asyncio
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, Mapping, Optional
 import threading
-import time
-from functools import lru_cache
+from types import MappingProxyType
+
+import aiofiles
+import orjson
 
 # Configure logging
 logger = logging.getLogger("config_manager")
 
 class ConfigManager:
     """
-    A thread-safe singleton class for managing bot configurations.
+    A thread-safe class for managing bot configurations.
     This class loads configurations from a JSON file and provides
-    methods to access and modify them.
-    """
-    _instance = None
-    _lock = threading.Lock()
+    methods to access and modify them. Use the shared module-level
+    instance via get_config_manager().
     
-    def __new__(cls, *args, **kwargs):
-        with cls._lock:
-            if cls._instance is None:
-                cls._instance = super(ConfigManager, cls).__new__(cls)
-                cls._instance._initialized = False
-            return cls._instance
+    Writers build a new config dict and publish it with a single attribute
+    store, so readers never block. _writer_lock only serializes writers
+    (update, remove, save and reload) against each other.
+    """
     
     def __init__(self, config_path: str = "bot_config.json", auto_reload: bool = False, reload_interval: int = 300):
         """
@@ -31,63 +29,83 @@ class ConfigManager:
         
         Args:
             config_path: Path to the configuration file
-            auto_reload: Whether to automatically reload the configuration periodically
-            reload_interval: Time interval in seconds for auto-reload
+            auto_reload: Whether to reload the configuration when the file changes on disk
+            reload_interval: Seconds between checks in _async_reload_loop
         """
-        # Only initialize once
-        if self._initialized:
-            return
-            
-        self._initialized = True
         self.config_path = config_path
         self.auto_reload = auto_reload
         self.reload_interval = reload_interval
         self._config = {}
-        self._last_modified = 0
-        self._reload_thread = None
-        self._running = False
-        self._config_lock = threading.Lock()
+        self._config_view = MappingProxyType(self._config)
+        # Flattened {bot_name: config-with-name} map, rebuilt once per change so
+        # lookups are a single dict access
+        self._aliases = {}
+        self._aliases_view = MappingProxyType(self._aliases)
+        self._last_mtime_ns = 0
+        self._last_size = -1
+        self._file_missing = False
+        # Bumped on every publish so callers can tell cheaply whether to re-read
+        self.version = 0
+        self._polling = False  # True while _async_reload_loop keeps the config fresh
+        self._reload_task: Optional[asyncio.Task] = None
+        self._writer_lock = threading.Lock()  # Serializes writers; readers never take it
         
         # Load the initial configuration
         self.reload_config()
+    
+    def _parse_config(self, raw: bytes) -> Optional[Dict[str, Any]]:
+        """Parse raw file contents, returning None if they are not valid JSON."""
+        try:
+            config = orjson.loads(raw)
+        except orjson.JSONDecodeError as e:
+            logger.error("Failed to parse configuration file: %s", e)
+            return None
         
-        # Start auto-reload if enabled
-        if self.auto_reload:
-            self._start_auto_reload()
+        # Ensure the config has the expected structure
+        if "bot_aliases" not in config:
+            # If the root object directly contains bot configs, wrap them
+            config = {"bot_aliases": config}
+
+        # Drop malformed entries once here so readers can rely on every
+        # alias being a mapping
+        aliases = config["bot_aliases"]
+        invalid = [name for name, cfg in aliases.items() if not isinstance(cfg, dict)]
+        if invalid:
+            logger.warning("Ignoring malformed bot entries: %s", ", ".join(invalid))
+            config["bot_aliases"] = {
+                name: cfg for name, cfg in aliases.items() if isinstance(cfg, dict)
+            }
+
+        logger.info("Loaded configuration with %d bots", len(config["bot_aliases"]))
+        return config
     
-    def _load_config_from_file(self) -> Dict[str, Any]:
-        """Load configuration from the file."""
+    def _load_config_from_file(self) -> Optional[Dict[str, Any]]:
+        """Load configuration from the file, returning None if it can't be read."""
         try:
-            if not os.path.exists(self.config_path):
-                logger.error(f"Configuration file not found: {self.config_path}")
-                return {"bot_aliases": {}}
-                
-            # Check if file was modified
-            current_mtime = os.path.getmtime(self.config_path)
-            if current_mtime <= self._last_modified:
-                logger.debug("Configuration file not modified since last load")
-                return self._config
-                
-            with open(self.config_path, 'r') as f:
-                config = json.load(f)
-                
-            # Update the last modified time
-            self._last_modified = current_mtime
-            
-            # Ensure the config has the expected structure
-            if "bot_aliases" not in config:
-                # If the root object directly contains bot configs, wrap them
-                config = {"bot_aliases": config}
-                
-            logger.info(f"Loaded configuration with {len(config['bot_aliases'])} bots")
-            return config
-            
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse configuration file: {e}")
-            return {"bot_aliases": {}}
+            with open(self.config_path, 'rb') as f:
+                raw = f.read()
         except Exception as e:
-            logger.error(f"Failed to load configuration: {e}")
-            return {"bot_aliases": {}}
+            logger.error("Failed to load configuration: %s", e)
+            return None
+        return self._parse_config(raw)
+    
+    def _stat_if_changed(self) -> Optional[os.stat_result]:
+        """Return the file's stat result if it changed since the last load, else None."""
+        try:
+            st = os.stat(self.config_path)
+        except OSError:
+            # Readers call this on every lookup, so only report the first miss
+            if not self._file_missing:
+                logger.error("Configuration file not found: %s", self.config_path)
+                self._file_missing = True
+            return None
+        self._file_missing = False
+        # Nothing changed on disk: skip the read, the lock and the swap
+        if st.st_mtime_ns == self._last_mtime_ns and st.st_size == self._last_size:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Configuration file not modified since last load")
+            return None
+        return st
     
     def reload_config(self) -> bool:
         """
@@ -96,51 +114,103 @@ class ConfigManager:
         Returns:
             bool: True if successful, False otherwise
         """
+        st = self._stat_if_changed()
+        if st is None:
+            return not self._file_missing
         try:
-            new_config = self._load_config_from_file()
-            with self._config_lock:
-                self._config = new_config
+            self._publish_loaded(self._load_config_from_file(), st)
             return True
         except Exception as e:
-            logger.error(f"Error reloading configuration: {e}")
+            logger.error("Error reloading configuration: %s", e)
             return False
     
-    def _auto_reload_loop(self):
-        """Background thread for auto-reloading configuration."""
-        while self._running:
-            try:
-                time.sleep(self.reload_interval)
-                if self._running:  # Check again after sleep
-                    self.reload_config()
-            except Exception as e:
-                logger.error(f"Error in auto-reload loop: {e}")
+    async def _async_reload(self) -> bool:
+        """Like reload_config, but reads the file through aiofiles."""
+        st = self._stat_if_changed()
+        if st is None:
+            return not self._file_missing
+        try:
+            async with aiofiles.open(self.config_path, 'rb') as f:
+                raw = await f.read()
+            self._publish_loaded(self._parse_config(raw), st)
+            return True
+        except Exception as e:
+            logger.error("Error reloading configuration: %s", e)
+            return False
     
-    def _start_auto_reload(self):
-        """Start the auto-reload background thread."""
-        if self._reload_thread is not None and self._reload_thread.is_alive():
-            return
-            
-        self._running = True
-        self._reload_thread = threading.Thread(target=self._auto_reload_loop, daemon=True)
-        self._reload_thread.start()
-        logger.info("Started auto-reload thread")
+    def _publish_loaded(self, config: Optional[Dict[str, Any]], st: os.stat_result):
+        """
+        Publish a configuration read from the file whose stat result is st.
+        
+        A config that failed to load is replaced by an empty one and the stat
+        is not recorded, so the next read tries the file again.
+        """
+        with self._writer_lock:
+            # save_config records the stat of its own write under this lock;
+            # a reload that raced with it must not publish that snapshot over
+            # newer in-memory changes
+            if st.st_mtime_ns == self._last_mtime_ns and st.st_size == self._last_size:
+                return
+            if config is None:
+                config = {"bot_aliases": {}}
+            else:
+                self._last_mtime_ns = st.st_mtime_ns
+                self._last_size = st.st_size
+            self._publish(config)
+    
+    def _publish(self, config: Dict[str, Any]):
+        """Swap in a configuration and rebuild the read-only views handed to readers."""
+        aliases = {
+            name: MappingProxyType({**cfg, "name": name})
+            for name, cfg in config.get("bot_aliases", {}).items()
+        }
+        self._config = config
+        self._config_view = MappingProxyType(config)
+        self._aliases = aliases
+        self._aliases_view = MappingProxyType(aliases)
+        self.version += 1
+    
+    async def _async_reload_loop(self):
+        """
+        Poll the configuration file on the running event loop.
+        
+        While this runs, readers skip their own mtime check. The file is read
+        through aiofiles so a slow disk never stalls the loop.
+        """
+        self._polling = True
+        try:
+            while self.auto_reload:
+                await asyncio.sleep(self.reload_interval)
+                await self._async_reload()
+        finally:
+            self._polling = False
+    
+    def start_auto_reload(self) -> asyncio.Task:
+        """
+        Start polling the configuration file on the running event loop.
+        
+        Returns:
+            asyncio.Task: The polling task; calling this again while it runs
+            returns the same task
+        """
+        self.auto_reload = True
+        if self._reload_task is None or self._reload_task.done():
+            self._reload_task = asyncio.get_running_loop().create_task(self._async_reload_loop())
+        return self._reload_task
     
     def stop_auto_reload(self):
-        """Stop the auto-reload background thread."""
-        self._running = False
-        if self._reload_thread is not None:
-            self._reload_thread.join(timeout=1.0)
-            self._reload_thread = None
-            logger.info("Stopped auto-reload thread")
+        """Stop picking up configuration changes from disk, on read and in the polling task."""
+        self.auto_reload = False
+        if self._reload_task is not None:
+            self._reload_task.cancel()
+            self._reload_task = None
     
     @property
-    def config(self) -> Dict[str, Any]:
-        """Get the current configuration."""
-        with self._config_lock:
-            return self._config.copy()
+    def config(self) -> Mapping[str, Any]:
+        """Get a read-only view of the current configuration."""
+        return self._config_view
     
-    @lru_cache(maxsize=64)
-    def get_bot_config(self, bot_name: str) -> Optional[Dict[str, Any]]:
+    def get_bot_config(self, bot_name: str) -> Optional[Mapping[str, Any]]:
         """
         Get configuration for a specific bot.
         
@@ -148,47 +218,61 @@ class ConfigManager:
             bot_name: Name of the bot
             
         Returns:
-            Optional[Dict]: bot configuration or None if not found
+            Optional[Mapping]: read-only bot configuration or None if not found
         """
-        with self._config_lock:
-            bot_config = self._config.get("bot_aliases", {}).get(bot_name)
-            if bot_config:
-                # Create a copy with the name added
-                bot_config = bot_config.copy()
-                bot_config["name"] = bot_name
-            return bot_config
+        if self.auto_reload and not self._polling:
+            self.reload_config()
+        return self._aliases.get(bot_name)
     
-    def get_all_bots(self) -> Dict[str, Dict[str, Any]]:
+    def get_all_bots(self) -> Mapping[str, Mapping[str, Any]]:
         """
         Get configurations for all bots.
         
+        The returned mapping and its entries are shared read-only views rebuilt
+        on every change; copy an entry with dict() before mutating it.
+        
         Returns:
-            Dict: Dictionary of bot configurations with names
+            Mapping: Bot configurations with names, keyed by bot name
         """
-        with self._config_lock:
-            bots = {}
-            for bot_name, bot_config in self._config.get("bot_aliases", {}).items():
-                config_with_name = bot_config.copy()
-                config_with_name["name"] = bot_name
-                bots[bot_name] = config_with_name
-            return bots
+        if self.auto_reload and not self._polling:
+            self.reload_config()
+        return self._aliases_view
     
     def save_config(self) -> bool:
         """
         Save the current configuration back to the file.
         
+        The file is written to a temporary path and moved into place with
+        os.replace, so a crash mid-write never leaves a truncated config.
+        
         Returns:
             bool: True if successful, False otherwise
         """
+        tmp_path = f"{self.config_path}.{threading.get_ident()}.tmp"
         try:
-            with self._config_lock:
-                with open(self.config_path, 'w') as f:
-                    json.dump(self._config, f, indent=2)
-                self._last_modified = os.path.getmtime(self.config_path)
-            logger.info(f"Configuration saved to {self.config_path}")
+            # Published configs are never mutated in place, so the snapshot
+            # can be serialized without holding the lock
+            payload = orjson.dumps(self._config, option=orjson.OPT_INDENT_2)
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+                # rename keeps the inode, so this is also the stat of the final file
+                st = os.fstat(f.fileno())
+            # Replace and record the stat together, so a concurrent reload
+            # either sees the old file or recognizes this write as our own
+            with self._writer_lock:
+                os.replace(tmp_path, self.config_path)
+                self._last_mtime_ns = st.st_mtime_ns
+                self._last_size = st.st_size
+            logger.info("Configuration saved to %s", self.config_path)
             return True
         except Exception as e:
-            logger.error(f"Failed to save configuration: {e}")
+            logger.error("Failed to save configuration: %s", e)
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
             return False
     
     def update_bot_config(self, bot_name: str, config: Dict[str, Any]) -> bool:
@@ -202,18 +286,56 @@ class ConfigManager:
         Returns:
             bool: True if successful, False otherwise
         """
+        return self.update_bots({bot_name: config})
+    
+    def update_bots(self, updates: Mapping[str, Dict[str, Any]]) -> bool:
+        """
+        Update or add several bot configurations in one publish.
+        
+        Args:
+            updates: Bot configurations keyed by bot name
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            with self._writer_lock:
+                # Copy-then-swap so readers never see a half-applied change
+                new_config = dict(self._config)
+                new_config["bot_aliases"] = {**new_config.get("bot_aliases", {}), **updates}
+                self._publish(new_config)
+            
+            return True
+        except Exception as e:
+            logger.error("Failed to update bot configuration: %s", e)
+            return False
+    
+    def update_bot_field(self, bot_name: str, field: str, value: Any) -> bool:
+        """
+        Set a single field of an existing bot configuration.
+        
+        Args:
+            bot_name: Name of the bot
+            field: Field to set
+            value: New value of the field
+            
+        Returns:
+            bool: True if successful, False if the bot does not exist or the update failed
+        """
         try:
-            with self._config_lock:
-                if "bot_aliases" not in self._config:
-                    self._config["bot_aliases"] = {}
-                self._config["bot_aliases"][bot_name] = config
-                
-            # Clear the cache for this bot
-            self.get_bot_config.cache_clear()
+            with self._writer_lock:
+                aliases = self._config.get("bot_aliases", {})
+                if bot_name not in aliases:
+                    logger.error("Cannot update field %s of unknown bot %s", field, bot_name)
+                    return False
+                # Only the edited bot's entry is copied
+                new_config = dict(self._config)
+                new_config["bot_aliases"] = {**aliases, bot_name: {**aliases[bot_name], field: value}}
+                self._publish(new_config)
             
             return True
         except Exception as e:
-            logger.error(f"Failed to update bot configuration: {e}")
+            logger.error("Failed to update bot configuration: %s", e)
             return False
     
     def remove_bot_config(self, bot_name: str) -> bool:
@@ -223,20 +345,35 @@ class ConfigManager:
         Args:
             bot_name: Name of the bot
             
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        return self.remove_bots((bot_name,))
+    
+    def remove_bots(self, bot_names: Iterable[str]) -> bool:
+        """
+        Remove several bot configurations in one publish.
+        
+        Args:
+            bot_names: Names of the bots to remove
+            
         Returns:
             bool: True if successful, False otherwise
         """
         try:
-            with self._config_lock:
-                if "bot_aliases" in self._config and bot_name in self._config["bot_aliases"]:
-                    del self._config["bot_aliases"][bot_name]
-                    
-            # Clear the cache for this bot
-            self.get_bot_config.cache_clear()
+            names = set(bot_names)
+            with self._writer_lock:
+                aliases = self._config.get("bot_aliases", {})
+                if not names.isdisjoint(aliases):
+                    new_config = dict(self._config)
+                    new_config["bot_aliases"] = {
+                        name: cfg for name, cfg in aliases.items() if name not in names
+                    }
+                    self._publish(new_config)
             
             return True
         except Exception as e:
-            logger.error(f"Failed to remove bot configuration: {e}")
+            logger.error("Failed to remove bot configuration: %s", e)
             return False
 
 # Create a default instance
@@ -253,24 +390,30 @@ def get_config_manager(config_path: str = None, auto_reload: bool = None, reload
         reload_interval: Optional new reload interval
         
     Returns:
-        ConfigManager: The singleton ConfigManager instance
+        ConfigManager: The shared ConfigManager instance
     """
     global config_manager
     
-    if config_path is not None or auto_reload is not None or reload_interval is not None:
-        # Create with new settings
-        new_config_path = config_path or config_manager.config_path
-        new_auto_reload = auto_reload if auto_reload is not None else config_manager.auto_reload
-        new_reload_interval = reload_interval or config_manager.reload_interval
-        
-        # Stop current auto-reload if running
-        config_manager.stop_auto_reload()
-        
-        # Create new instance (will reuse singleton)
-        config_manager = ConfigManager(
-            config_path=new_config_path,
-            auto_reload=new_auto_reload,
-            reload_interval=new_reload_interval
-        )
+    # Common case: callers just want the shared instance
+    if config_path is None and auto_reload is None and reload_interval is None:
+        return config_manager
+    
+    new_auto_reload = auto_reload if auto_reload is not None else config_manager.auto_reload
+    new_reload_interval = reload_interval or config_manager.reload_interval
+    
+    if config_path is None or config_path == config_manager.config_path:
+        # Same file: adjust the existing instance instead of reloading it
+        config_manager.auto_reload = new_auto_reload
+        config_manager.reload_interval = new_reload_interval
+        return config_manager
+    
+    # Stop picking up file changes on the old settings
+    config_manager.stop_auto_reload()
+    
+    config_manager = ConfigManager(
+        config_path=config_path,
+        auto_reload=new_auto_reload,
+        reload_interval=new_reload_interval
+    )
     
     return config_manager
\ No newline at end of file
@@ -1,7 +1,4 @@
-import json
 import os
-from os import getenv
-from pathlib import Path
 from dotenv import load_dotenv
 from TelegramBot.logging import LOGGER
 
@@ -19,71 +16,64 @@ config_manager = get_config_manager(
     reload_interval=60  # Check for config changes every minute
 )
 
-# Check for .env or config.env files
+# Check for .env or config.env files. load_dotenv writes into os.environ, which
+# child processes inherit, so the probe only has to run once per process tree.
 env_files = ["config.env", ".env"]
-env_loaded = False
+env_loaded = os.environ.get("_TELEGRAMBOT_CONFIG_LOADED") == "1"
 
-for env_file in env_files:
-    if Path(env_file).exists():
-        logger.info(f"Loading environment from {env_file}")
+if not env_loaded:
+    for env_file in env_files:
+        try:
+            os.stat(env_file)
+        except FileNotFoundError:
+            continue
+        logger.info("Loading environment from %s", env_file)
         load_dotenv(env_file)
         env_loaded = True
         break
 
-if not env_loaded:
-    logger.info("No .env file found, using system environment variables")
+    if not env_loaded:
+        logger.info("No .env file found, using system environment variables")
+
+    os.environ["_TELEGRAMBOT_CONFIG_LOADED"] = "1"
+
+# Snapshot the environment once; the bot never re-reads it after startup
+_ENV = dict(os.environ)
 
 # Load configuration
-API_ID = int(getenv("API_ID", 0))
-API_HASH = getenv("API_HASH", "")
-BOT_TOKEN = getenv("BOT_TOKEN", "")
-CHANNEL_ID = getenv("CHANNEL_ID", "-100")
-LOG_CHANNEL = getenv("LOG_CHANNEL", None)
-# Helper function to handle both direct env vars and .env format
-def parse_json_env(key, default=None):
-    value = getenv(key, "")
-    if not value:
-        return default if default is not None else []
-    
-    # Clean up the value (remove extra spaces, etc.)
-    value = value.strip()
-    
-    # Check if it's already a valid JSON string
-    if (value.startswith('[') and value.endswith(']')) or \
-       (value.startswith('{') and value.endswith('}')):
-        try:
-            return json.loads(value)
-        except json.JSONDecodeError:
-            pass
-    
-    # Try to interpret as a single value
-    try:
-        # For a single integer
-        return [int(value)]
-    except ValueError:
-        # If not an integer, return as a single string item
-        return [value]
+API_ID = int(_ENV.get("API_ID", 0))
+API_HASH = _ENV.get("API_HASH", "")
+BOT_TOKEN = _ENV.get("BOT_TOKEN", "")
+CHANNEL_ID = _ENV.get("CHANNEL_ID", "-100")
+LOG_CHANNEL = _ENV.get("LOG_CHANNEL", None)
+# Helper function to parse user ID lists given as "[1, 2]", "1,2" or "1"
+def _parse_id_list(raw):
+    if not raw:
+        return []
+    return [int(x) for x in raw.strip().strip("[]").split(",") if x.strip()]
 
 # Handle owner and sudo users
 try:
-    OWNER_USERID = parse_json_env("OWNER_USERID", [])
+    OWNER_USERID = _parse_id_list(_ENV.get("OWNER_USERID"))
     SUDO_USERID = OWNER_USERID.copy()
 except Exception as error:
-    logger.error(f"Failed to parse OWNER_USERID: {error}")
+    logger.error("Failed to parse OWNER_USERID: %s", error)
     OWNER_USERID = []
     SUDO_USERID = []
 
 try:
-    sudo_users = parse_json_env("SUDO_USERID", [])
+    sudo_users = _parse_id_list(_ENV.get("SUDO_USERID"))
     if sudo_users:
         SUDO_USERID += sudo_users
         logger.info("Added sudo user(s)")
 except Exception as error:
     logger.info("No sudo user(s) mentioned in config.")
 
-# Ensure unique user IDs
-SUDO_USERID = list(set(SUDO_USERID))
-MONGO_URI = getenv("MONGO_URI", "")
+# Freeze the ID sets (which also drops duplicates) so authorization
+# checks are a single hash lookup
+OWNER_USERID = frozenset(OWNER_USERID)
+SUDO_USERID = frozenset(SUDO_USERID)
+MONGO_URI = _ENV.get("MONGO_URI", "")
 
 # Validate essential configuration
 if not API_ID or not API_HASH or not BOT_TOKEN:
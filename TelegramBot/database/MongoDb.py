@@ -107,3 +107,4 @@ database = mongodb.TelegramBot
 # Initiating different collections from database TelegramBot.
 users = MongoDB(database.users)
 chats = MongoDB(database.chats)
+bot_status = MongoDB(database.bot_status)
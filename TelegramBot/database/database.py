@@ -1,8 +1,8 @@
-from typing import Union
+from typing import Optional, Union
 from datetime import datetime
 
 from pyrogram.types import Message
-from TelegramBot.database.MongoDb import users, chats
+from TelegramBot.database.MongoDb import users, chats, bot_status
 
 
 async def save_user(user: Message) -> None:
@@ -22,3 +22,15 @@ async def save_chat(chatid: Union[int, str]) -> None:
 
     insert_format = {"date": datetime.now()}
     return await chats.update_document(chatid, insert_format)
+
+
+async def save_bot_status(bot_name: str, status: dict) -> None:
+    """Saves (or updates) the last known status of a monitored bot."""
+
+    return await bot_status.update_document(bot_name, status)
+
+
+async def get_bot_status(bot_name: str) -> Optional[dict]:
+    """Return the last known status of a monitored bot, or None if it was never saved."""
+
+    return await bot_status.read_document(bot_name, {"_id": 0})
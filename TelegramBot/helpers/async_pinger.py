@@ -7,7 +7,7 @@ with configurable retry mechanisms, timeouts, and logging.
 
 Features:
 - Asynchronous bot checking with controlled concurrency
-- Configurable retry mechanism with exponential backoff
+- Configurable retry mechanism with jittered exponential backoff
 - Detailed logging and reporting
 - Timeout handling
 - HTTP status code validation
@@ -16,38 +16,61 @@ Features:
 
 import asyncio
 import logging
+import random
+import sys
 import time
-from dataclasses import dataclass
-from enum import Enum
-from typing import Callable, Dict, List, Optional, Union, Any
+from dataclasses import dataclass, field
+from enum import IntEnum
+from types import MappingProxyType
+from typing import Callable, Dict, List, Optional, Tuple, Union, Any
 import aiohttp
 from aiohttp.client_exceptions import (
     ClientConnectorError, 
     ClientOSError,
     ServerDisconnectedError,
-    ClientResponseError,
     TooManyRedirects,
     ClientPayloadError,
     ClientError
 )
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger("async_ping")
 
-class PingStatus(Enum):
-    """Enum representing the status of a ping operation."""
-    SUCCESS = "success"
-    FAILURE = "failure"
-    TIMEOUT = "timeout"
-    ERROR = "error"
-    RETRY = "retry"
+# Shared, read-only default headers; pass headers= to override per instance
+_DEFAULT_HEADERS = MappingProxyType({
+    "User-Agent": "AsyncPinger/1.0",
+    "Accept": "*/*",
+})
+
+# HTTP statuses worth retrying; any other invalid status fails immediately
+_RETRYABLE_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Return a Retry-After delay in seconds, or None if absent or not numeric."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None  # HTTP-date form; fall back to the backoff schedule
+
+
+# dataclass(slots=True) needs Python 3.10; older interpreters get a plain dataclass
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Private generator for retry jitter; no need to share state with the global one
+_jitter = random.Random()
 
+class PingStatus(IntEnum):
+    """Enum representing the status of a ping operation. Use name.lower() for display."""
+    SUCCESS = 1
+    FAILURE = 2
+    TIMEOUT = 3
+    ERROR = 4
+    RETRY = 5
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class PingResult:
     """Data class representing the result of a ping operation."""
     url: str
@@ -55,23 +78,25 @@ class PingResult:
     status_code: Optional[int] = None
     response_time: Optional[float] = None
     retry_count: int = 0
-    error: Optional[Exception] = None
-    timestamp: float = time.time()
+    error: Optional[Union[Exception, str]] = None
+    timestamp: float = field(default_factory=time.time)
     response_data: Optional[Any] = None
 
     def is_success(self) -> bool:
         """Check if ping was successful."""
-        return self.status == PingStatus.SUCCESS
+        return self.status is PingStatus.SUCCESS
 
     def to_dict(self) -> Dict:
         """Convert result to dictionary."""
+        response_time = self.response_time
+        error = self.error
         return {
             "url": self.url,
-            "status": self.status.value,
+            "status": self.status.name.lower(),
             "status_code": self.status_code,
-            "response_time_ms": round(self.response_time * 1000) if self.response_time else None,
+            "response_time_ms": round(response_time * 1000) if response_time else None,
             "retry_count": self.retry_count,
-            "error": str(self.error) if self.error else None,
+            "error": str(error) if error else None,
             "timestamp": self.timestamp,
         }
 
@@ -97,6 +122,8 @@ class AsyncPinger:
         on_failure: Optional[Callable[[PingResult], None]] = None,
         on_retry: Optional[Callable[[PingResult], None]] = None,
         session: Optional[aiohttp.ClientSession] = None,
+        connector: Optional[aiohttp.BaseConnector] = None,
+        connect_timeout: Optional[float] = None,
     ):
         """
         Initialize AsyncPinger with configuration options.
@@ -112,30 +139,58 @@ class AsyncPinger:
             on_success: Callback function for successful pings
             on_failure: Callback function for failed pings
             on_retry: Callback function called before a retry attempt
+                      (callbacks may be plain or async and are scheduled on the loop)
             session: Optional aiohttp session to use instead of creating a new one
+            connector: Optional connector shared with other pingers; it is left
+                       open when this pinger closes
+            connect_timeout: Optional cap in seconds on establishing the connection,
+                             within timeout (default: no separate cap, so slow
+                             cold-starting hosts only hit the total timeout)
         """
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self.retry_backoff_factor = retry_backoff_factor
         self.timeout = timeout
         self.concurrent_limit = concurrent_limit
-        self.valid_status_codes = valid_status_codes or [200]
-        self.headers = headers or {
-            "User-Agent": "AsyncPinger/1.0",
-            "Accept": "*/*",
-        }
+        self.valid_status_codes = frozenset(valid_status_codes or (200,))
+        self.retryable_status_codes = _RETRYABLE_STATUS_CODES
+        self.headers = headers if headers is not None else _DEFAULT_HEADERS
         self.on_success = on_success
         self.on_failure = on_failure
         self.on_retry = on_retry
         self._session = session
-        self._semaphore = None  # Will be initialized in ping_multiple
         self._own_session = False
+        self._connector = connector
+        self._callback_tasks = set()  # Strong refs so coroutine callbacks aren't GC'd mid-run
+        # Built once and reused by every request made through our session
+        self._timeout_obj = aiohttp.ClientTimeout(total=timeout, connect=connect_timeout)
         
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create an aiohttp client session."""
         if self._session is None or self._session.closed:
             logger.debug("(async ping) Creating new session")
-            self._session = aiohttp.ClientSession(headers=self.headers)
+            if self._connector is not None:
+                # Shared pool: the session must not close it on exit
+                connector, connector_owner = self._connector, False
+            else:
+                # The connector's pool limit bounds concurrency across all pings;
+                # the aiodns-backed resolver keeps lookups off the thread pool
+                connector = aiohttp.TCPConnector(
+                    limit=self.concurrent_limit,
+                    limit_per_host=max(2, self.concurrent_limit // 4),
+                    resolver=aiohttp.AsyncResolver(),
+                    ttl_dns_cache=600,
+                    use_dns_cache=True,
+                    keepalive_timeout=30,
+                    enable_cleanup_closed=True,
+                )
+                connector_owner = True
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                timeout=self._timeout_obj,
+                connector=connector,
+                connector_owner=connector_owner,
+            )
             self._own_session = True
         return self._session
     
@@ -147,39 +202,79 @@ class AsyncPinger:
             self._session = None
             self._own_session = False
     
+    def _dispatch(self, callback: Optional[Callable[[PingResult], Any]], result: PingResult) -> None:
+        """
+        Schedule a user callback on the loop instead of running it inline.
+        
+        Plain functions run via call_soon and coroutine functions as tasks, so
+        a slow callback never holds up the ping that triggered it.
+        """
+        if callback is None:
+            return
+        if asyncio.iscoroutinefunction(callback):
+            task = asyncio.create_task(callback(result))
+            self._callback_tasks.add(task)
+            task.add_done_callback(self._callback_tasks.discard)
+        else:
+            asyncio.get_running_loop().call_soon(callback, result)
+    
     def _calculate_retry_delay(self, retry_count: int) -> float:
-        """Calculate the delay before the next retry attempt using exponential backoff."""
-        return self.retry_delay * (self.retry_backoff_factor ** retry_count)
+        """
+        Calculate the delay before the next retry attempt using exponential backoff.
+        
+        The delay is jittered by +/-50% so pings that fail together don't all
+        retry at the same instant.
+        """
+        base = self.retry_delay * (self.retry_backoff_factor ** retry_count)
+        return _jitter.uniform(base * 0.5, base * 1.5)
     
-    async def ping(self, url: str, retry_count: int = 0) -> PingResult:
+    async def _request(self, session: aiohttp.ClientSession, url: str, head: bool) -> aiohttp.ClientResponse:
+        """
+        Send the probe request and release the connection before returning.
+        
+        HEAD skips the response body; endpoints that reject it with 405/501 are
+        retried with GET. The returned response keeps its status and headers.
+        """
+        if head:
+            async with session.head(url, timeout=self._timeout_obj, allow_redirects=True) as response:
+                if response.status not in (405, 501):
+                    return response
+        async with session.get(url, timeout=self._timeout_obj, allow_redirects=True) as response:
+            return response
+    
+    async def ping(self, url: str, head: bool = True) -> PingResult:
         """
         Ping a single URL and return the result.
         
+        Retries with exponential backoff until a valid status code is seen or
+        max_retries is exhausted.
+        
         Args:
-            url: The URL to ping
-            retry_count: Current retry attempt (used internally)
+            url: The URL to ping, including its scheme (ping_multiple adds https:// when missing)
+            head: Probe with HEAD (falling back to GET) instead of GET. Pass
+                  False for URLs that must receive a GET, such as deploy hooks
             
         Returns:
             PingResult: Object containing the result of the ping operation
         """
-        if not url.startswith(('http://', 'https://')):
-            url = f"https://{url}"
-            
-        start_time = time.time()
-        
         try:
             session = await self._get_session()
-            if session is None or session.closed:
-              logger.error(f"Session invalid for {url}, recreating...")
-              self._session = None  # Force recreation
-              session = await self._get_session()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error("Unexpected error while pinging %s: %s", url, e)
+            error_result = PingResult(url=url, status=PingStatus.ERROR, error=e)
+            self._dispatch(self.on_failure, error_result)
+            return error_result
+        
+        for retry_count in range(self.max_retries + 1):
+            start_time = time.monotonic()
+            can_retry = retry_count < self.max_retries
+            retry_delay = None
             
-            async with session.get(
-                url, 
-                timeout=self.timeout,
-                allow_redirects=True
-            ) as response:
-                response_time = time.time() - start_time
+            try:
+                response = await self._request(session, url, head)
+                response_time = time.monotonic() - start_time
                 
                 if response.status in self.valid_status_codes:
                     result = PingResult(
@@ -189,122 +284,89 @@ class AsyncPinger:
                         response_time=response_time,
                         retry_count=retry_count
                     )
-                    logger.info(f"Successfully pinged {url} (status: {response.status}, time: {response_time:.2f}s)")
+                    logger.info("Successfully pinged %s (status: %d, time: %.2fs)", url, response.status, response_time)
                     
-                    if self.on_success:
-                        self.on_success(result)
+                    self._dispatch(self.on_success, result)
                         
                     return result
-                else:
-                    error_msg = f"Invalid status code: {response.status}"
-                    logger.warning(f"Failed to ping {url}: {error_msg}")
+                
+                logger.warning("Failed to ping %s: Invalid status code: %d", url, response.status)
+                error = f"HTTP {response.status}"
+                
+                # 4xx other than 408/425/429 won't change on retry
+                if not can_retry or response.status not in self.retryable_status_codes:
+                    failure_result = PingResult(
+                        url=url,
+                        status=PingStatus.FAILURE,
+                        status_code=response.status,
+                        response_time=response_time,
+                        retry_count=retry_count,
+                        error=error
+                    )
                     
-                    if retry_count < self.max_retries:
-                        retry_delay = self._calculate_retry_delay(retry_count)
-                        retry_result = PingResult(
-                            url=url,
-                            status=PingStatus.RETRY,
-                            status_code=response.status,
-                            response_time=response_time,
-                            retry_count=retry_count,
-                            error=ClientResponseError(
-                                request_info=response.request_info,
-                                history=response.history,
-                                status=response.status,
-                                message=error_msg,
-                                headers=response.headers
-                            )
-                        )
-                        
-                        if self.on_retry:
-                            self.on_retry(retry_result)
-                            
-                        logger.info(f"Retrying {url} in {retry_delay:.2f}s (attempt {retry_count + 1}/{self.max_retries})")
-                        await asyncio.sleep(retry_delay)
-                        return await self.ping(url, retry_count + 1)
-                    else:
-                        failure_result = PingResult(
-                            url=url,
-                            status=PingStatus.FAILURE,
-                            status_code=response.status,
-                            response_time=response_time,
-                            retry_count=retry_count,
-                            error=ClientResponseError(
-                                request_info=response.request_info,
-                                history=response.history,
-                                status=response.status,
-                                message=error_msg,
-                                headers=response.headers
-                            )
-                        )
+                    self._dispatch(self.on_failure, failure_result)
                         
-                        if self.on_failure:
-                            self.on_failure(failure_result)
-                            
-                        return failure_result
-                        
-        except asyncio.TimeoutError:
-            response_time = time.time() - start_time
-            logger.warning(f"Timeout while pinging {url} after {response_time:.2f}s")
-            
-            if retry_count < self.max_retries:
-                retry_delay = self._calculate_retry_delay(retry_count)
+                    return failure_result
+                
+                retry_delay = _parse_retry_after(response.headers.get("Retry-After"))
                 retry_result = PingResult(
                     url=url,
                     status=PingStatus.RETRY,
+                    status_code=response.status,
                     response_time=response_time,
                     retry_count=retry_count,
-                    error=asyncio.TimeoutError(f"Request timed out after {self.timeout}s")
+                    error=error
                 )
-                
-                if self.on_retry:
-                    self.on_retry(retry_result)
                     
-                logger.info(f"Retrying {url} in {retry_delay:.2f}s (attempt {retry_count + 1}/{self.max_retries})")
-                await asyncio.sleep(retry_delay)
-                return await self.ping(url, retry_count + 1)
-            else:
-                timeout_result = PingResult(
+            except asyncio.TimeoutError:
+                response_time = time.monotonic() - start_time
+                logger.warning("Timeout while pinging %s after %.2fs", url, response_time)
+                
+                status = PingStatus.RETRY if can_retry else PingStatus.TIMEOUT
+                retry_result = PingResult(
                     url=url,
-                    status=PingStatus.TIMEOUT,
+                    status=status,
                     response_time=response_time,
                     retry_count=retry_count,
                     error=asyncio.TimeoutError(f"Request timed out after {self.timeout}s")
                 )
                 
-                if self.on_failure:
-                    self.on_failure(timeout_result)
+                if not can_retry:
+                    self._dispatch(self.on_failure, retry_result)
+                    return retry_result
                     
-                return timeout_result
+            except (
+                ClientConnectorError,
+                ClientOSError,
+                ServerDisconnectedError,
+                TooManyRedirects,
+                ClientPayloadError,
+                ClientError
+            ) as e:
+                response_time = time.monotonic() - start_time
+                logger.warning("Error while pinging %s: %s", url, e)
                 
-        except (
-            ClientConnectorError,
-            ClientOSError,
-            ServerDisconnectedError,
-            TooManyRedirects,
-            ClientPayloadError,
-            ClientError
-        ) as e:
-            response_time = time.time() - start_time
-            logger.warning(f"Error while pinging {url}: {str(e)}")
-            
-            if retry_count < self.max_retries:
-                retry_delay = self._calculate_retry_delay(retry_count)
+                status = PingStatus.RETRY if can_retry else PingStatus.ERROR
                 retry_result = PingResult(
                     url=url,
-                    status=PingStatus.RETRY,
+                    status=status,
                     response_time=response_time,
                     retry_count=retry_count,
                     error=e
                 )
                 
-                if self.on_retry:
-                    self.on_retry(retry_result)
-                    
-                logger.info(f"Retrying {url} in {retry_delay:.2f}s (attempt {retry_count + 1}/{self.max_retries})")
-                await asyncio.sleep(retry_delay)
-                return await self.ping(url, retry_count + 1)
-            else:
+                if not can_retry:
+                    self._dispatch(self.on_failure, retry_result)
+                    return retry_result
+            
+            except asyncio.CancelledError:
+                # Let shutdown cancel the ping instead of reporting it as an error
+                raise
+            
+            except Exception as e:
+                response_time = time.monotonic() - start_time
+                logger.error("Unexpected error while pinging %s: %s", url, e)
+                
                 error_result = PingResult(
                     url=url,
                     status=PingStatus.ERROR,
@@ -313,69 +375,79 @@ class AsyncPinger:
                     error=e
                 )
                 
-                if self.on_failure:
-                    self.on_failure(error_result)
+                self._dispatch(self.on_failure, error_result)
                     
                 return error_result
-        
-        except Exception as e:
-            response_time = time.time() - start_time
-            logger.error(f"Unexpected error while pinging {url}: {str(e)}")
             
-            error_result = PingResult(
-                url=url,
-                status=PingStatus.ERROR,
-                response_time=response_time,
-                retry_count=retry_count,
-                error=e
-            )
+            # Only retry-worthy outcomes fall through to here
+            self._dispatch(self.on_retry, retry_result)
             
-            if self.on_failure:
-                self.on_failure(error_result)
-                
-            return error_result
+            if retry_delay is None:
+                retry_delay = self._calculate_retry_delay(retry_count)
+            logger.info("Retrying %s in %.2fs (attempt %d/%d)", url, retry_delay, retry_count + 1, self.max_retries)
+            await asyncio.sleep(retry_delay)
 
-    async def ping_multiple(self, urls: List[str], sequential: bool = False) -> List[PingResult]:
+    async def ping_multiple(self, urls: List[str], sequential: bool = False, head: bool = True) -> List[PingResult]:
       """
       Ping multiple URLs and return their results.
       
       Args:
           urls: List of URLs to ping
           sequential: If True, ping URLs one by one; if False, ping concurrently
-                      with limit set by concurrent_limit (default: False)
+                      with the connection pool capped at concurrent_limit (default: False)
+          head: Probe with HEAD (falling back to GET); see ping (default: True)
       
       Returns:
           List[PingResult]: List of ping results
       """
-      self._semaphore = asyncio.Semaphore(1 if sequential else self.concurrent_limit)
+      if not urls:
+          return []
+      
+      # Normalize once here rather than on every attempt inside ping
+      urls = [url if url.startswith(('http://', 'https://')) else f"https://{url}" for url in urls]
       
-      async def _ping_with_semaphore(url):
-          async with self._semaphore:
-              return await self.ping(url)
+      # A fixed pool of workers drains a bounded queue, so memory scales with
+      # concurrent_limit rather than with len(urls). Sequential mode is one worker.
+      worker_count = 1 if sequential else max(1, min(self.concurrent_limit, len(urls)))
+      queue: asyncio.Queue = asyncio.Queue(maxsize=worker_count * 2)
+      results: List[PingResult] = [None] * len(urls)
       
-      tasks = [_ping_with_semaphore(url) for url in urls]
-      results = await asyncio.gather(*tasks, return_exceptions=True)
+      async def _produce():
+          for item in enumerate(urls):
+              await queue.put(item)
+          for _ in range(worker_count):
+              await queue.put(None)
       
-      # Convert exceptions to PingResult objects
-      processed_results = []
-      for i, result in enumerate(results):
-          if isinstance(result, Exception):
-              processed_results.append(
-                  PingResult(
-                      url=urls[i],
-                      status=PingStatus.ERROR,
-                      error=result
-                  )
-              )
-          else:
-              processed_results.append(result)
+      async def _work():
+          while True:
+              item = await queue.get()
+              if item is None:
+                  return
+              index, url = item
+              # ping reports every failure as a PingResult; anything it raises is a bug
+              results[index] = await self.ping(url, head)
       
-      return processed_results
+      await asyncio.gather(_produce(), *(_work() for _ in range(worker_count)))
+      return results
+
         
-    async def close(self):
+    async def close(self) -> None:
+        """Close the session. Safe to call more than once."""
         if self._session is not None and not self._session.closed:
             await self._session.close()
-            self._session = None
+        self._session = None
+        self._own_session = False
+    
+    async def open(self) -> None:
+        """Create the session now rather than on the first ping."""
+        await self._get_session()
+    
+    async def __aenter__(self) -> "AsyncPinger":
+        await self.open()
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
             
             
     async def ping_sequential(self, urls: List[str]) -> List[PingResult]:
@@ -391,16 +463,45 @@ class AsyncPinger:
         return await self.ping_multiple(urls, sequential=True)
 
 
+# Long-lived pingers handed out by get_shared_pinger, keyed by (max_retries, timeout)
+_shared_pingers: Dict[Tuple[int, float], AsyncPinger] = {}
+
+def get_shared_pinger(max_retries: int = 3, timeout: float = 10.0, concurrent_limit: int = 10) -> AsyncPinger:
+    """
+    Get a process-wide pinger for one-off pings.
+    
+    Pingers are created on first use and keep their session, so repeated
+    pings reuse keep-alive connections instead of paying for DNS, TCP and
+    TLS setup every time. concurrent_limit only applies when the pinger
+    is created.
+    
+    Args:
+        max_retries: Maximum number of retry attempts
+        timeout: Request timeout in seconds
+        concurrent_limit: Maximum number of concurrent requests
+        
+    Returns:
+        AsyncPinger: The shared pinger for these settings
+    """
+    key = (max_retries, float(timeout))
+    pinger = _shared_pingers.get(key)
+    if pinger is None:
+        pinger = _shared_pingers[key] = AsyncPinger(
+            max_retries=max_retries,
+            retry_delay=1.0,
+            timeout=timeout,
+            concurrent_limit=concurrent_limit,
+        )
+    return pinger
+
+async def close_shared_pingers() -> None:
+    """Close the sessions of all pingers handed out by get_shared_pinger."""
+    for pinger in _shared_pingers.values():
+        await pinger.close()
+
+
 # Example usage
 async def main():
-    # Basic example
-    pinger = AsyncPinger(
-        max_retries=3,
-        retry_delay=2.0,
-        timeout=10.0,
-        valid_status_codes=[200, 201, 204]
-    )
-    
     # Define callbacks
     def on_success(result):
         print(f"✓ {result.url} is alive! Response time: {result.response_time:.2f}s")
@@ -408,18 +509,6 @@ async def main():
     def on_failure(result):
         print(f"✗ {result.url} failed after {result.retry_count} retries: {result.error}")
     
-    # Create pinger with callbacks
-    advanced_pinger = AsyncPinger(
-        max_retries=2,
-        retry_delay=1.5,
-        retry_backoff_factor=2.0,
-        timeout=5.0,
-        concurrent_limit=5,
-        valid_status_codes=[200, 201, 202, 204],
-        on_success=on_success,
-        on_failure=on_failure
-    )
-    
     # List of bots to check
     bots = [
         "https://animeosint-telgram.onrender.com",
@@ -429,26 +518,42 @@ async def main():
         "https://ares-tgbot-3.onrender.com/alive"
     ]
     
-    # Ping bots concurrently
-    print("\nPinging bots concurrently:")
-    results = await advanced_pinger.ping_multiple(bots)
-    
-    # Print summary
-    print("\nSummary:")
-    success_count = sum(1 for r in results if r.is_success())
-    print(f"Success: {success_count}/{len(bots)}")
-    print(f"Failed: {len(bots) - success_count}/{len(bots)}")
-    
-    # Ping bots sequentially
-    print("\nPinging bots sequentially:")
-    sequential_results = await advanced_pinger.ping_sequential(bots)
-    
-    # Print sequential summary
-    print("\nSequential Summary:")
-    success_count = sum(1 for r in sequential_results if r.is_success())
-    print(f"Success: {success_count}/{len(bots)}")
-    print(f"Failed: {len(bots) - success_count}/{len(bots)}")
+    # Create pinger with callbacks; the context manager closes its session
+    async with AsyncPinger(
+        max_retries=2,
+        retry_delay=1.5,
+        retry_backoff_factor=2.0,
+        timeout=5.0,
+        concurrent_limit=5,
+        valid_status_codes=[200, 201, 202, 204],
+        on_success=on_success,
+        on_failure=on_failure
+    ) as advanced_pinger:
+        # Ping bots concurrently
+        print("\nPinging bots concurrently:")
+        results = await advanced_pinger.ping_multiple(bots)
+        
+        # Print summary
+        print("\nSummary:")
+        success_count = sum(1 for r in results if r.is_success())
+        print(f"Success: {success_count}/{len(bots)}")
+        print(f"Failed: {len(bots) - success_count}/{len(bots)}")
+        
+        # Ping bots sequentially
+        print("\nPinging bots sequentially:")
+        sequential_results = await advanced_pinger.ping_sequential(bots)
+        
+        # Print sequential summary
+        print("\nSequential Summary:")
+        success_count = sum(1 for r in sequential_results if r.is_success())
+        print(f"Success: {success_count}/{len(bots)}")
+        print(f"Failed: {len(bots) - success_count}/{len(bots)}")
 
 
 if __name__ == "__main__":
+    # Only the standalone example configures logging; importers keep their own setup
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
     asyncio.run(main())
\ No newline at end of file
@@ -1,10 +1,9 @@
 import asyncio
+import heapq
 import time
 import logging
-from typing import Dict, Optional, List, Any, Union
-from datetime import datetime
-import html
-from dataclasses import dataclass, asdict
+from typing import Dict, Optional, List, Any, Tuple
+from dataclasses import dataclass, field
 from enum import Enum, auto
 
 from pyrogram import Client
@@ -18,6 +17,38 @@ from TelegramBot.config import get_config_manager
 # Configure logging with proper format
 logger = logging.getLogger('background_pinger')
 
+# Same escapes as html.escape(quote=True), applied in one C-level pass
+_HTML_ESCAPE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#x27;",
+})
+
+
+def _esc(value: Any) -> str:
+    """HTML-escape a value for the status message."""
+    if not isinstance(value, str):
+        value = str(value)
+    return value.translate(_HTML_ESCAPE)
+
+
+def _format_ts(ts: float) -> str:
+    """Format an epoch timestamp the way the status message shows it."""
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(ts))
+
+
+_STATUS_HEADER = (
+    "╭━━━━━━━━━━━━━━━━━━━━━╮\n"
+    "│ 📊 Bot Status Report                    │\n"
+    "╰━━━━━━━━━━━━━━━━━━━━━╯\n\n"
+)
+
+# Telegram's limit on message text
+_MAX_MESSAGE_LENGTH = 4096
+_TRUNCATED_NOTICE = "… (truncated)"
+
 
 class RedeployStatus(Enum):
     """Enum to represent redeploy status."""
@@ -30,27 +61,48 @@ class RedeployStatus(Enum):
 @dataclass
 class RedeployInfo:
     """Data class to store redeploy information."""
-    time: str
+    time_ts: float  # epoch seconds
     success: bool
     reason: Optional[str] = None
 
+    @property
+    def time(self) -> str:
+        """Redeploy time formatted for display."""
+        return _format_ts(self.time_ts)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        return asdict(self)
+        return {
+            "time_ts": self.time_ts,
+            "success": self.success,
+            "reason": self.reason,
+            "time": self.time,
+        }
 
 
 @dataclass
 class BotStatusEntry:
     """Data class to store bot status information."""
     result: PingResult
-    timestamp: str
+    url: str
+    timestamp_ts: float  # epoch seconds
     config: Dict[str, Any]
     last_redeploy: Optional[RedeployInfo] = None
+    name_html: str = ""  # HTML-escaped bot name, carried over between pings
+    _timestamp: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def timestamp(self) -> str:
+        """Check time formatted for display, computed once per entry."""
+        if self._timestamp is None:
+            self._timestamp = _format_ts(self.timestamp_ts)
+        return self._timestamp
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
         result = {
             "result": self.result,
+            "url": self.url,
             "timestamp": self.timestamp,
             "config": self.config,
         }
@@ -97,160 +149,279 @@ class BackgroundPinger:
         self.config_manager = get_config_manager()
         
         self.running = False
-        self.tasks: List[asyncio.Task] = []
-        self.last_results: Dict[str, BotStatusEntry] = {}
-        self.update_lock = asyncio.Lock()
+        self._wake_event = asyncio.Event()
+        self.last_results: Dict[str, BotStatusEntry] = {}  # keyed by bot name
+        
+        # One scheduler task pings every due bot in a single batch
+        self._scheduler_task: Optional[asyncio.Task] = None
+        self._bot_configs: Dict[str, Dict[str, Any]] = {}
+        self._next_due: Dict[str, float] = {}  # time.monotonic() due times
+        # Min-heap of (due time, bot name). Entries whose time no longer
+        # matches _next_due are stale and skipped when popped.
+        self._due_heap: List[Tuple[float, str]] = []
+        self._error_counts: Dict[str, int] = {}
+        self._config_version = -1  # config_manager.version last merged into _bot_configs
+        # Automatic redeploys run beside the scheduler so a slow redeploy
+        # never delays other bots' pings; keyed by bot name so each bot has
+        # at most one in flight (this also keeps the tasks referenced)
+        self._redeploy_tasks: Dict[str, asyncio.Task] = {}
+        
+        # Status message edits are coalesced by a single update task, the
+        # only one that edits the message while the pinger runs
+        self._update_task: Optional[asyncio.Task] = None
+        self._pending_update = asyncio.Event()
+        self.message_update_debounce = 0.25  # seconds
         
-        # Create task tracking dictionary
-        self.bot_tasks: Dict[str, asyncio.Task] = {}
+        # time.time() of the last status message edit; see _handle_result
+        self._last_edit_ts = 0.0
         
-        # Message update throttling
-        self.last_message_update = 0
-        self.message_update_interval = 5  # seconds
+        # (fingerprint, text, keyboard) of the last status message sent
+        self._render_cache: Optional[Tuple[int, str, Optional[InlineKeyboardMarkup]]] = None
+        
+        # last_results keys in display order; rebuilt only when bots are
+        # added or removed
+        self._sorted_cache: Optional[List[str]] = None
+        self._sorted_dirty = True
+        
+        # Inline keyboard, rebuilt only when the (name, url_bot) pairs change
+        self._keyboard_cache: Optional[InlineKeyboardMarkup] = None
+        self._keyboard_key: Optional[Tuple[Tuple[str, Optional[str]], ...]] = None
 
-    async def ping_bot(self, bot_config: Dict[str, Any]) -> Optional[PingResult]:
+    async def _sleep_until_woken(self, timeout: float):
         """
-        Ping a bot URL and return the result.
-        
-        Args:
-            bot_config: Bot configuration dictionary
-            
-        Returns:
-            PingResult if successful, None otherwise
+        Sleep for up to `timeout` seconds, waking early if the schedule changes
+        or the pinger is stopped.
         """
-        url = bot_config.get("url", "")
-        if not url:
-            logger.warning(f"No URL provided for bot: {bot_config.get('name', 'unknown')}")
-            return None
-            
         try:
-            results = await self.pinger.ping_multiple([url])
-            return results[0] if results else None
-        except Exception as e:
-            logger.error(f"Error pinging {url}: {e}", exc_info=True)
-            return None
+            await asyncio.wait_for(self._wake_event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        self._wake_event.clear()
+
+    def _schedule(self, bot_name: str, bot_config: Dict[str, Any]):
+        """Start monitoring a bot, pinging it on the next scheduler tick."""
+        self._bot_configs[bot_name] = bot_config
+        self._set_due(bot_name, time.monotonic())
+        self._error_counts.pop(bot_name, None)
+        self._wake_event.set()
+        logger.info(
+            "Scheduled background ping for %s (%s) every %s seconds",
+            bot_name, bot_config.get('url', ''), bot_config.get('ping_interval', 300)
+        )
+
+    def _set_due(self, bot_name: str, due: float):
+        """Schedule the next ping of a bot at `due` (time.monotonic() seconds)."""
+        self._next_due[bot_name] = due
+        heapq.heappush(self._due_heap, (due, bot_name))
+
+    def _pop_due(self, now: float) -> List[str]:
+        """Pop the bots due at `now` off the heap, dropping stale entries."""
+        heap = self._due_heap
+        due = {}
+        while heap and heap[0][0] <= now:
+            ts, bot_name = heapq.heappop(heap)
+            if self._next_due.get(bot_name) == ts:
+                due[bot_name] = None
+        # Leave a live entry on top so the caller can sleep until it
+        while heap and self._next_due.get(heap[0][1]) != heap[0][0]:
+            heapq.heappop(heap)
+        return list(due)
+
+    def _unschedule(self, bot_name: str) -> bool:
+        """Stop monitoring a bot. Returns True if it was being monitored."""
+        self._next_due.pop(bot_name, None)
+        self._error_counts.pop(bot_name, None)
+        return self._bot_configs.pop(bot_name, None) is not None
+
+    async def _scheduler_loop(self):
+        """Ping every bot that is due in one batch, then sleep until the next one is due."""
+        while self.running:
+            now = time.monotonic()
+            due = self._pop_due(now)
+            if due:
+                await self._ping_due(due, now)
+            
+            if self._due_heap:
+                wait = max(0.05, self._due_heap[0][0] - time.monotonic())
+            else:
+                wait = 1.0
+            await self._sleep_until_woken(wait)
+
+    def _refresh_configs(self):
+        """Merge config changes into the monitored bots, if anything was published since the last call."""
+        # get_all_bots also picks up on-disk changes when auto_reload is on
+        all_bots = self.config_manager.get_all_bots()
+        version = self.config_manager.version
+        if version == self._config_version:
+            return
+        self._config_version = version
+        
+        for bot_name, bot_config in self._bot_configs.items():
+            fresh_config = all_bots.get(bot_name)
+            if not fresh_config:
+                continue
+            ping_interval = bot_config.get("ping_interval", 300)
+            bot_config.update(fresh_config)
+            new_interval = bot_config.get("ping_interval", 300)
+            if new_interval != ping_interval:
+                logger.info("Ping interval for %s changed from %ss to %ss", bot_name, ping_interval, new_interval)
 
-    async def ping_and_update(self, bot_config: Dict[str, Any]):
+    async def _ping_due(self, due: List[str], tick_start: float):
         """
-        Continuously ping a bot and update its status.
+        Refresh the configs of the due bots, ping them with one ping_multiple
+        call and fan the results back out.
         
         Args:
-            bot_config: Bot configuration dictionary
+            due: Names of the bots whose ping is due
+            tick_start: time.monotonic() when the tick started; the next ping is scheduled from it
         """
-        url = bot_config.get("url", "")
-        bot_name = bot_config.get("name", url)
-        ping_interval = bot_config.get("ping_interval", 300)
+        self._refresh_configs()
         
-        logger.info(f"Starting background ping for {bot_name} ({url}) every {ping_interval} seconds")
+        batch = []
+        for bot_name in due:
+            bot_config = self._bot_configs[bot_name]
+            if not bot_config.get("url"):
+                logger.warning("No URL provided for bot: %s", bot_name)
+                self._set_due(bot_name, tick_start + bot_config.get("ping_interval", 300))
+                continue
+            batch.append((bot_name, bot_config))
         
-        consecutive_errors = 0
-        max_consecutive_errors = 3
-        backoff_multiplier = 1.0
+        if not batch:
+            return
         
-        while self.running:
+        try:
+            results = await self.pinger.ping_multiple([cfg["url"] for _, cfg in batch])
+        except Exception as e:
+            logger.error("Error pinging batch of %d bots: %s", len(batch), e, exc_info=True)
+            results = [None] * len(batch)
+        
+        for (bot_name, bot_config), result in zip(batch, results):
+            # The bot may have been removed while the batch was in flight
+            if bot_name not in self._bot_configs:
+                continue
+            
+            ping_interval = bot_config.get("ping_interval", 300)
             try:
-                # Check if bot config has been updated
-                fresh_config = self.config_manager.get_bot_config(bot_name)
-                if fresh_config:
-                    # Update local config with fresh values
-                    for key, value in fresh_config.items():
-                        bot_config[key] = value
-                    
-                    # Check if ping interval changed
-                    new_interval = bot_config.get("ping_interval", 300)
-                    if new_interval != ping_interval:
-                        logger.info(f"Ping interval for {bot_name} changed from {ping_interval}s to {new_interval}s")
-                        ping_interval = new_interval
-                
-                start_time = time.time()
-                result = await self.ping_bot(bot_config)
-                
                 if result:
-                    # Reset error counter on successful ping
-                    consecutive_errors = 0
-                    backoff_multiplier = 1.0
-                    
-                    # Create status entry
-                    entry = BotStatusEntry(
-                        result=result,
-                        timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                        config=bot_config,
-                    )
-                    
-                    # Preserve last redeploy info if exists
-                    if url in self.last_results and self.last_results[url].last_redeploy:
-                        entry.last_redeploy = self.last_results[url].last_redeploy
-                    
-                    self.last_results[url] = entry
-                    
-                    # Update status message if needed
-                    current_time = time.time()
-                    if (self.admin_chat_id and self.status_message_id and 
-                            (current_time - self.last_message_update >= self.message_update_interval)):
-                        await self.update_status_message()
-                        self.last_message_update = current_time
-                    
-                    # Automatic redeploy logic
-                    if (not result.is_success() and 
-                            bot_config.get("redeploy_url") and 
-                            bot_config.get("auto_redeploy", False)):
-                        
-                        redeploy_status = await self._check_redeploy_eligibility(url)
-                        
-                        if redeploy_status == RedeployStatus.SUCCESS:
-                            await self.trigger_redeploy(url, automatic=True)
-                            logger.info(f"Automatic redeploy triggered for {bot_name}")
-                        elif redeploy_status == RedeployStatus.COOLDOWN:
-                            logger.info(f"Skipping redeploy for {bot_name} due to cooldown")
-                
-                elapsed = time.time() - start_time
-                sleep_time = max(0.1, ping_interval - elapsed)
-                await asyncio.sleep(sleep_time)
-                
-            except asyncio.CancelledError:
-                logger.info(f"Ping task for {bot_name} was cancelled")
-                break
+                    self._handle_result(bot_name, bot_config, result)
+                self._error_counts.pop(bot_name, None)
+                self._set_due(bot_name, tick_start + ping_interval)
             except Exception as e:
-                logger.error(f"Error in ping loop for {bot_name}: {e}", exc_info=True)
+                logger.error("Error in ping loop for %s: %s", bot_name, e, exc_info=True)
                 
-                # Implement exponential backoff for errors
-                consecutive_errors += 1
-                if consecutive_errors > max_consecutive_errors:
-                    backoff_multiplier = min(backoff_multiplier * 1.5, 5.0)  # Cap at 5x
-                
-                # Use backoff for the sleep time
+                # Exponential backoff after repeated errors, capped at 5x
+                errors = self._error_counts.get(bot_name, 0) + 1
+                self._error_counts[bot_name] = errors
+                backoff_multiplier = min(1.5 ** max(0, errors - 3), 5.0)
                 adjusted_interval = ping_interval * backoff_multiplier
-                logger.warning(f"Using backoff for {bot_name}: sleeping for {adjusted_interval:.1f}s")
-                await asyncio.sleep(adjusted_interval)
+                logger.warning("Using backoff for %s: sleeping for %.1fs", bot_name, adjusted_interval)
+                self._set_due(bot_name, time.monotonic() + adjusted_interval)
+
+    @staticmethod
+    def _result_changed(prev: PingResult, result: PingResult) -> bool:
+        """Whether a new result differs enough from the previous one to re-render."""
+        return (
+            prev.status is not result.status
+            or prev.status_code != result.status_code
+            or abs((prev.response_time or 0) - (result.response_time or 0)) > 0.05
+        )
+
+    def _handle_result(self, bot_name: str, bot_config: Dict[str, Any], result: PingResult):
+        """Record a ping result, refresh the status message and start an auto-redeploy if needed."""
+        # Create status entry
+        entry = BotStatusEntry(
+            result=result,
+            url=bot_config["url"],
+            timestamp_ts=time.time(),
+            config=bot_config,
+        )
+        
+        # Carry over the escaped name and last redeploy info
+        previous = self.last_results.get(bot_name)
+        if previous is None:
+            self._sorted_dirty = True
+            entry.name_html = _esc(bot_name)
+        else:
+            entry.name_html = previous.name_html
+            if previous.last_redeploy:
+                entry.last_redeploy = previous.last_redeploy
+        
+        self.last_results[bot_name] = entry
+        
+        # Wake the update task when the status visibly changed. A steady
+        # healthy bot would otherwise cost an edit per ping just to move its
+        # "Last Check" time, so that only refreshes once the shown times are
+        # a ping interval old.
+        if (previous is None
+                or self._result_changed(previous.result, result)
+                or entry.timestamp_ts - self._last_edit_ts >= bot_config.get("ping_interval", 300)):
+            self._pending_update.set()
+        
+        # Automatic redeploy logic
+        if (not result.is_success() and 
+                bot_config.get("redeploy_url") and 
+                bot_config.get("auto_redeploy", False) and
+                bot_name not in self._redeploy_tasks):
+            task = asyncio.get_running_loop().create_task(self._auto_redeploy(bot_name))
+            self._redeploy_tasks[bot_name] = task
+            task.add_done_callback(lambda _: self._redeploy_tasks.pop(bot_name, None))
+
+    async def _auto_redeploy(self, bot_name: str):
+        """Redeploy a failing bot unless it is still in its redeploy cooldown."""
+        try:
+            redeploy_status = await self._check_redeploy_eligibility(bot_name)
+            
+            if redeploy_status == RedeployStatus.SUCCESS:
+                await self.trigger_redeploy(bot_name, automatic=True)
+                logger.info("Automatic redeploy triggered for %s", bot_name)
+            elif redeploy_status == RedeployStatus.COOLDOWN:
+                logger.info("Skipping redeploy for %s due to cooldown", bot_name)
+        except Exception as e:
+            logger.error("Error in automatic redeploy for %s: %s", bot_name, e, exc_info=True)
 
-    async def _check_redeploy_eligibility(self, url: str) -> RedeployStatus:
+    async def _update_loop(self):
+        """
+        Edit the status message whenever results change, coalescing every
+        change that arrives within message_update_debounce into one edit.
+        """
+        while self.running:
+            await self._pending_update.wait()
+            if not self.running:
+                break
+            await asyncio.sleep(self.message_update_debounce)
+            self._pending_update.clear()
+            await self._edit_status_message()
+
+    async def _check_redeploy_eligibility(self, bot_name: str) -> RedeployStatus:
         """
         Check if a bot is eligible for redeploy.
         
         Args:
-            url: Bot URL
+            bot_name: Name of the bot
             
         Returns:
             RedeployStatus enum indicating eligibility
         """
-        if url not in self.last_results:
+        entry = self.last_results.get(bot_name)
+        if entry is None:
             return RedeployStatus.FAILED
             
-        entry = self.last_results[url]
         if entry.last_redeploy:
-            try:
-                last_time = entry.last_redeploy.time
-                last_time_dt = datetime.strptime(last_time, "%Y-%m-%d %H:%M:%S")
-                time_since_last = (datetime.now() - last_time_dt).total_seconds()
-                cooldown = entry.config.get("redeploy_cooldown", 300)  # Default 5-minute cooldown
-                
-                if time_since_last < cooldown:
-                    return RedeployStatus.COOLDOWN
-            except ValueError:
-                logger.warning(f"Invalid last_redeploy time format: {last_time}")
+            time_since_last = time.time() - entry.last_redeploy.time_ts
+            cooldown = entry.config.get("redeploy_cooldown", 300)  # Default 5-minute cooldown
+            
+            if time_since_last < cooldown:
+                return RedeployStatus.COOLDOWN
         
         return RedeployStatus.SUCCESS
     
+    def _sorted_results(self) -> List[Tuple[str, BotStatusEntry]]:
+        """Return last_results items sorted by bot name, reusing the cached order."""
+        if self._sorted_dirty or self._sorted_cache is None:
+            self._sorted_cache = sorted(self.last_results)
+            self._sorted_dirty = False
+        return [(bot_name, self.last_results[bot_name]) for bot_name in self._sorted_cache]
+
     def get_inline_keyboard(self) -> Optional[InlineKeyboardMarkup]:
         """
         Generate inline keyboard for status message.
@@ -261,20 +432,21 @@ class BackgroundPinger:
         if not self.last_results:
             return None
 
-        bots = sorted(
-            self.last_results.items(),
-            key=lambda x: x[1].config.get("name", x[0])
+        key = tuple(
+            (bot_name, data.config.get("url_bot"))
+            for bot_name, data in self._sorted_results()
         )
+        if key == self._keyboard_key:
+            return self._keyboard_cache
 
         buttons = []
-        for url, data in bots:
-            config = data.config
-            bot_name = config.get("name", url)
-            url_bot = config.get("url_bot")
+        for bot_name, url_bot in key:
             if url_bot:
                 buttons.append(InlineKeyboardButton(bot_name, url=url_bot))
 
+        self._keyboard_key = key
         if not buttons:
+            self._keyboard_cache = None
             return None
 
         # Arrange buttons in rows of 2
@@ -286,96 +458,132 @@ class BackgroundPinger:
         control_buttons.append(InlineKeyboardButton("⚙️ Config", callback_data="manage_config"))
         keyboard.append(control_buttons)
         
-        return InlineKeyboardMarkup(keyboard)
+        self._keyboard_cache = InlineKeyboardMarkup(keyboard)
+        return self._keyboard_cache
 
-    def format_status_message(self) -> str:
+    def format_status_message(self, limit: Optional[int] = None) -> str:
         """
         Format the status message with current bot statuses.
         
+        Args:
+            limit: Optional maximum length. Rendering stops at the last bot
+                that fits and a truncation notice is appended, so the rest
+                is never formatted and no HTML tag is cut in half.
+        
         Returns:
             Formatted status message string
         """
-        message = (
-            "╭━━━━━━━━━━━━━━━━━━━━━╮\n"
-            "│ 📊 Bot Status Report                    │\n"
-            "╰━━━━━━━━━━━━━━━━━━━━━╯\n\n"
-        )
-
         if not self.last_results:
-            message += "◇ No bots have been checked yet.\n"
-        else:
-            bots = sorted(
-                self.last_results.items(),
-                key=lambda x: x[1].config.get("name", x[0])
-            )
+            return (_STATUS_HEADER + "◇ No bots have been checked yet.\n").rstrip()
 
-            for url, data in bots:
-                result = data.result
-                timestamp = data.timestamp
-                config = data.config
-                bot_name = config.get("name", url)
-                last_redeploy = data.last_redeploy
+        bots = self._sorted_results()
 
-                status_emoji = "●" if result.is_success() else "○"
-                status_text = (
-                    f"{result.status_code}" if result.is_success() else f"{result.status.value}"
-                )
-                response_time = (
-                    f"{result.response_time:.2f}s" if result.response_time else "N/A"
-                )
+        parts = [_STATUS_HEADER]
+        budget = limit - len(_TRUNCATED_NOTICE) if limit else None
+        total = len(_STATUS_HEADER)
+        for bot_name, data in bots:
+            result = data.result
+            last_redeploy = data.last_redeploy
 
-                # Escape HTML special characters
-                bot_name = html.escape(str(bot_name))
-                status_text = html.escape(str(status_text))
-                response_time = html.escape(str(response_time))
-                timestamp = html.escape(str(timestamp))
-
-                message += (
-                    f"◇ <b>{bot_name}</b>\n"
-                    f"  ○ 𝚂𝚝𝚊𝚝𝚞𝚜: [{status_emoji}] <i>{status_text}</i>\n"
-                    f"  ○ 𝚁𝚎𝚜𝚙𝚘𝚗𝚜𝚎 𝚃𝚒𝚖𝚎: <i>{response_time}</i>\n"
-                    f"  ○ 𝙻𝚊𝚜𝚝 𝙲𝚑𝚎𝚌𝚔: <i>{timestamp}</i>\n"
-                )
+            status_emoji = "●" if result.is_success() else "○"
+            status_text = (
+                f"{result.status_code}" if result.is_success() else f"{result.status.name.lower()}"
+            )
+            response_time = (
+                f"{result.response_time:.2f}s" if result.response_time else "N/A"
+            )
 
-                # Add redeploy info if available
-                if last_redeploy:
-                    redeploy_time = html.escape(str(last_redeploy.time))
-                    redeploy_status = "Success" if last_redeploy.success else "Failed"
-                    reason = f" ({html.escape(last_redeploy.reason)})" if last_redeploy.reason else ""
-                    message += (
-                        f"  ○ <blockquote>𝚁𝚎𝚍𝚎𝚙𝚕𝚘𝚢: {redeploy_status}{reason} at {redeploy_time}</blockquote>\n"
-                    )
+            # Escape HTML special characters
+            bot_name = data.name_html or _esc(bot_name)
+            status_text = _esc(status_text)
+            response_time = _esc(response_time)
+            timestamp = _esc(data.timestamp)
+
+            block = (
+                f"◇ <b>{bot_name}</b>\n"
+                f"  ○ 𝚂𝚝𝚊𝚝𝚞𝚜: [{status_emoji}] <i>{status_text}</i>\n"
+                f"  ○ 𝚁𝚎𝚜𝚙𝚘𝚗𝚜𝚎 𝚃𝚒𝚖𝚎: <i>{response_time}</i>\n"
+                f"  ○ 𝙻𝚊𝚜𝚝 𝙲𝚑𝚎𝚌𝚔: <i>{timestamp}</i>\n"
+            )
 
-                message += "\n"
+            # Add redeploy info if available
+            if last_redeploy:
+                redeploy_time = _esc(last_redeploy.time)
+                redeploy_status = "Success" if last_redeploy.success else "Failed"
+                reason = f" ({_esc(last_redeploy.reason)})" if last_redeploy.reason else ""
+                block += (
+                    f"  ○ <blockquote>𝚁𝚎𝚍𝚎𝚙𝚕𝚘𝚢: {redeploy_status}{reason} at {redeploy_time}</blockquote>\n"
+                )
 
-        return message.rstrip()
+            block += "\n"
+            total += len(block)
+            if budget is not None and total > budget:
+                parts.append(_TRUNCATED_NOTICE)
+                break
+            parts.append(block)
+
+        return "".join(parts).rstrip()
+
+    def _status_fingerprint(self) -> int:
+        """Cheap hash of everything the status message and keyboard are rendered from."""
+        return hash(tuple(
+            (
+                bot_name,
+                entry.url,
+                entry.result.status,
+                entry.result.status_code,
+                entry.result.response_time,
+                entry.timestamp_ts,
+                id(entry.last_redeploy),
+                entry.config.get("url_bot"),
+            )
+            for bot_name, entry in self.last_results.items()
+        ))
 
     async def update_status_message(self):
-        """Update the status message in the admin chat."""
+        """
+        Update the status message in the admin chat.
+        
+        While the update task runs this only marks the message dirty; the
+        task renders the latest state, so requests made during an edit
+        collapse into a single follow-up edit.
+        """
+        if self._update_task is not None and not self._update_task.done():
+            self._pending_update.set()
+        else:
+            await self._edit_status_message()
+
+    async def _edit_status_message(self):
+        """Render the current state and edit the status message with it."""
         if not self.admin_chat_id or not self.status_message_id:
             return
 
         try:
-            async with self.update_lock:
-                message_text = self.format_status_message()
-                if len(message_text) > 4096:
-                    message_text = message_text[:4093] + "..."
-                inline_keyboard = self.get_inline_keyboard()
-
-                await self.client.edit_message_text(
-                    chat_id=self.admin_chat_id,
-                    message_id=self.status_message_id,
-                    text=message_text,
-                    reply_markup=inline_keyboard,
-                    parse_mode=ParseMode.HTML,
-                    disable_web_page_preview=True
-                )
+            # Nothing changed since the last edit: skip the render and the RPC
+            fingerprint = self._status_fingerprint()
+            if self._render_cache is not None and self._render_cache[0] == fingerprint:
+                return
+            
+            message_text = self.format_status_message(limit=_MAX_MESSAGE_LENGTH)
+            inline_keyboard = self.get_inline_keyboard()
+
+            await self.client.edit_message_text(
+                chat_id=self.admin_chat_id,
+                message_id=self.status_message_id,
+                text=message_text,
+                reply_markup=inline_keyboard,
+                parse_mode=ParseMode.HTML,
+                disable_web_page_preview=True
+            )
+            self._render_cache = (fingerprint, message_text, inline_keyboard)
+            self._last_edit_ts = time.time()
             logger.debug("Updated status message")
         except MessageNotModified:
             # It's normal if message hasn't changed
-            pass
+            self._render_cache = (fingerprint, message_text, inline_keyboard)
+            self._last_edit_ts = time.time()
         except Exception as e:
-            logger.error(f"Failed to update status message: {e}")
+            logger.error("Failed to update status message: %s", e)
             if "parse mode" in str(e).lower():
                 try:
                     # Try without parse mode as fallback
@@ -387,59 +595,60 @@ class BackgroundPinger:
                         parse_mode=None
                     )
                 except Exception as fallback_e:
-                    logger.error(f"Fallback update also failed: {fallback_e}")
+                    logger.error("Fallback update also failed: %s", fallback_e)
 
-    async def trigger_redeploy(self, url: str, automatic: bool = False) -> bool:
+    async def trigger_redeploy(self, bot_name: str, automatic: bool = False) -> bool:
         """
         Trigger a redeploy for a bot.
         
         Args:
-            url: Bot URL
+            bot_name: Name of the bot
             automatic: Whether this is an automatic redeploy
             
         Returns:
             True if successful, False otherwise
         """
-        if url not in self.last_results:
-            logger.warning(f"Cannot redeploy unknown URL: {url}")
+        bot_data = self.last_results.get(bot_name)
+        if bot_data is None:
+            logger.warning("Cannot redeploy unknown bot: %s", bot_name)
             return False
             
-        bot_data = self.last_results[url]
         config = bot_data.config
         redeploy_url = config.get("redeploy_url")
         
         if not redeploy_url:
-            logger.warning(f"No redeploy URL for {config.get('name', url)}")
+            logger.warning("No redeploy URL for %s", bot_name)
             return False
             
         if not automatic and not config.get("can_people_redeploy", False):
-            logger.info(f"Redeploy skipped for {config.get('name', url)}: can_people_redeploy is False")
+            logger.info("Redeploy skipped for %s: can_people_redeploy is False", bot_name)
             return False
             
         try:
-            result = await self.pinger.ping_multiple([redeploy_url])
+            result = await self.pinger.ping_multiple([redeploy_url], head=False)
             success = result[0].is_success() if result else False
-            redeploy_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            
             redeploy_info = RedeployInfo(
-                time=redeploy_time,
+                time_ts=time.time(),
                 success=success,
                 reason="Auto" if automatic else "Manual"
             )
             
-            self.last_results[url].last_redeploy = redeploy_info
+            # _handle_result may have replaced the entry while the redeploy
+            # request was in flight, so record it on the current one
+            current = self.last_results.get(bot_name)
+            if current is not None:
+                current.last_redeploy = redeploy_info
             
             logger.info(
-                f"Redeploy triggered for {config.get('name', url)}: "
-                f"{'Success' if success else 'Failed'} at {redeploy_time}"
+                "Redeploy triggered for %s: %s at %s",
+                bot_name, "Success" if success else "Failed", redeploy_info.time
             )
             
-            if self.admin_chat_id and self.status_message_id:
-                await self.update_status_message()
+            await self.update_status_message()
                 
             return success
         except Exception as e:
-            logger.error(f"Error triggering redeploy for {config.get('name', url)}: {e}")
+            logger.error("Error triggering redeploy for %s: %s", bot_name, e)
             return False
 
     async def start(self):
@@ -449,6 +658,11 @@ class BackgroundPinger:
             return
 
         self.running = True
+        self._wake_event.clear()
+        
+        # One pooled keep-alive session for the pinger's whole lifetime;
+        # stop() closes it
+        await self.pinger.open()
         
         # Get all bot configurations from the config manager
         bot_configs = self.config_manager.get_all_bots()
@@ -456,14 +670,17 @@ class BackgroundPinger:
         for bot_name, bot_config in bot_configs.items():
             # Skip bots marked as disabled
             if bot_config.get("disabled", False):
-                logger.info(f"Skipping disabled bot: {bot_name}")
+                logger.info("Skipping disabled bot: %s", bot_name)
                 continue
                 
-            task = asyncio.create_task(self.ping_and_update(bot_config))
-            self.tasks.append(task)
-            self.bot_tasks[bot_name] = task
+            # The config manager hands out a shared view; keep our own copy
+            self._schedule(bot_name, dict(bot_config))
 
-        logger.info(f"Started background pinger with {len(self.tasks)} bots")
+        self._scheduler_task = asyncio.create_task(self._scheduler_loop())
+        if self.admin_chat_id and self.status_message_id:
+            self._pending_update.clear()
+            self._update_task = asyncio.create_task(self._update_loop())
+        logger.info("Started background pinger with %d bots", len(self._bot_configs))
 
     async def stop(self):
         """Stop the background pinger."""
@@ -471,18 +688,28 @@ class BackgroundPinger:
             return
 
         self.running = False
+        self._wake_event.set()
+        self._pending_update.set()
         
-        # Cancel all tasks
-        for task in self.tasks:
-            if not task.done():
+        # A redeploy still in flight is abandoned along with the session
+        for task in self._redeploy_tasks.values():
+            task.cancel()
+        tasks = {t for t in (self._scheduler_task, self._update_task) if t is not None}
+        tasks.update(self._redeploy_tasks.values())
+        if tasks:
+            # Sleeping tasks wake and exit on their own; only cancel the ones
+            # still in the middle of a ping batch or an edit
+            _, pending = await asyncio.wait(tasks, timeout=1.0)
+            for task in pending:
                 task.cancel()
-                
-        # Wait for tasks to finish
-        if self.tasks:
-            await asyncio.gather(*self.tasks, return_exceptions=True)
+            await asyncio.gather(*tasks, return_exceptions=True)
             
-        self.tasks = []
-        self.bot_tasks = {}
+        self._scheduler_task = None
+        self._update_task = None
+        self._bot_configs = {}
+        self._next_due = {}
+        self._due_heap = []
+        self._error_counts = {}
         await self.pinger.close()  # Close the session 
         logger.info("Stopped background pinger")
 
@@ -510,40 +737,28 @@ class BackgroundPinger:
         try:
             # Validate required fields
             if not bot_config.get("url"):
-                logger.error(f"Missing required URL for bot {bot_name}")
+                logger.error("Missing required URL for bot %s", bot_name)
                 return False
                 
-            # Update the config
-            bot_config["name"] = bot_name
-            success = self.config_manager.update_bot_config(bot_name, bot_config)
+            # Update the config with a copy: published configs are never
+            # mutated in place, and _publish adds the name to the read views
+            success = self.config_manager.update_bot_config(bot_name, {**bot_config})
             if not success:
                 return False
                 
             # Save changes to disk
             self.config_manager.save_config()
             
-            # If already running, stop the current task for this bot and start a new one
+            # If already running, (re)schedule the bot for an immediate ping.
+            # Like start(), schedule a private copy of the published view,
+            # since _refresh_configs updates scheduled configs in place.
             if self.running:
-                if bot_name in self.bot_tasks and not self.bot_tasks[bot_name].done():
-                    self.bot_tasks[bot_name].cancel()
-                    # Wait for task to cancel
-                    try:
-                        await asyncio.wait_for(
-                            asyncio.gather(self.bot_tasks[bot_name], return_exceptions=True), 
-                            timeout=2.0
-                        )
-                    except asyncio.TimeoutError:
-                        logger.warning(f"Timeout waiting for task to cancel for bot {bot_name}")
-                
-                # Start a new task for this bot
-                task = asyncio.create_task(self.ping_and_update(bot_config))
-                self.tasks.append(task)
-                self.bot_tasks[bot_name] = task
-                logger.info(f"Started monitoring bot: {bot_name}")
+                self._schedule(bot_name, dict(self.config_manager.get_bot_config(bot_name)))
+                logger.info("Started monitoring bot: %s", bot_name)
             
             return True
         except Exception as e:
-            logger.error(f"Error adding/updating bot {bot_name}: {e}", exc_info=True)
+            logger.error("Error adding/updating bot %s: %s", bot_name, e, exc_info=True)
             return False
             
     async def remove_bot(self, bot_name: str) -> bool:
@@ -557,42 +772,23 @@ class BackgroundPinger:
             bool: True if successful, False otherwise
         """
         try:
-            # Stop monitoring this bot if running
-            if bot_name in self.bot_tasks and self.running:
-                if not self.bot_tasks[bot_name].done():
-                    self.bot_tasks[bot_name].cancel()
-                    try:
-                        await asyncio.wait_for(
-                            asyncio.gather(self.bot_tasks[bot_name], return_exceptions=True), 
-                            timeout=2.0
-                        )
-                    except asyncio.TimeoutError:
-                        logger.warning(f"Timeout waiting for task to cancel for bot {bot_name}")
-                
-                # Remove from tasks list
-                if self.bot_tasks[bot_name] in self.tasks:
-                    self.tasks.remove(self.bot_tasks[bot_name])
-                del self.bot_tasks[bot_name]
+            # Stop monitoring this bot
+            self._unschedule(bot_name)
             
             # Remove from config
             success = self.config_manager.remove_bot_config(bot_name)
             if success:
                 # Save changes to disk
                 self.config_manager.save_config()
-                logger.info(f"Removed bot: {bot_name}")
+                logger.info("Removed bot: %s", bot_name)
             
             # Remove from last results
-            urls_to_remove = []
-            for url, entry in self.last_results.items():
-                if entry.config.get("name") == bot_name:
-                    urls_to_remove.append(url)
-            
-            for url in urls_to_remove:
-                del self.last_results[url]
+            if self.last_results.pop(bot_name, None) is not None:
+                self._sorted_dirty = True
             
             return success
         except Exception as e:
-            logger.error(f"Error removing bot {bot_name}: {e}", exc_info=True)
+            logger.error("Error removing bot %s: %s", bot_name, e, exc_info=True)
             return False
             
     async def get_bot_status(self, bot_name: Optional[str] = None) -> Dict[str, Any]:
@@ -605,18 +801,10 @@ class BackgroundPinger:
         Returns:
             Dictionary with bot statuses
         """
-        result = {}
-        
         if bot_name:
             # Get status for a specific bot
-            for url, entry in self.last_results.items():
-                if entry.config.get("name") == bot_name:
-                    result[bot_name] = entry.to_dict()
-                    break
-        else:
-            # Get status for all bots
-            for url, entry in self.last_results.items():
-                bot_name = entry.config.get("name", url)
-                result[bot_name] = entry.to_dict()
-                
-        return result
\ No newline at end of file
+            entry = self.last_results.get(bot_name)
+            return {bot_name: entry.to_dict()} if entry else {}
+        
+        # Get status for all bots
+        return {name: entry.to_dict() for name, entry in self.last_results.items()}
@@ -1,20 +1,36 @@
+import atexit
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 # Removing old log files if they exist and starting logging from a fresh file.
 if os.path.exists("logs.txt"):
     os.remove("logs.txt")
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="[%(asctime)s - %(levelname)s] - %(name)s - %(message)s",
+formatter = logging.Formatter(
+    "[%(asctime)s - %(levelname)s] - %(name)s - %(message)s",
     datefmt="%d-%b-%y %H:%M:%S",
-    handlers=[
-        RotatingFileHandler("logs.txt", mode="w+", maxBytes=5000000, backupCount=3),
-        logging.StreamHandler(),
-    ]
 )
+handlers = [
+    RotatingFileHandler("logs.txt", mode="w+", maxBytes=5000000, backupCount=3),
+    logging.StreamHandler(),
+]
+for handler in handlers:
+    handler.setFormatter(formatter)
+
+# Records are queued and written by a listener thread, so a slow disk or a
+# backed-up stdout pipe never blocks the event loop.
+log_queue = queue.SimpleQueue()
+log_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+log_listener.start()
+atexit.register(log_listener.stop)
+
+queue_handler = QueueHandler(log_queue)
+# The listener's handlers add the prefix; only the message (and any
+# traceback) is rendered before queueing
+queue_handler.setFormatter(logging.Formatter("%(message)s"))
+logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
 
 # Suppressing pyrogram INFO messages.
 logging.getLogger("pyrogram").setLevel(logging.ERROR)
@@ -1,19 +1,25 @@
 from pyrogram import filters
 from pyrogram.enums import ParseMode, ChatType
+from pyrogram.errors import MessageNotModified
 from pyrogram.types import (
     CallbackQuery,
     InlineKeyboardButton,
     InlineKeyboardMarkup,
     Message,
 )
+import asyncio
+import bisect
+import functools
+import itertools
 import json
 import logging
 import re
+import sys
 import time
-from typing import Dict, List, Any, Union, Optional
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Tuple
 
 from TelegramBot import bot
-from TelegramBot.database import database
 from TelegramBot.config import get_config_manager, OWNER_USERID, SUDO_USERID
 
 # Configure logging
@@ -21,39 +27,129 @@ logger = logging.getLogger("config_editor")
 
 # Constants
 CONFIG_TIMEOUT = 600  # 10 minutes timeout for config sessions
+# Sessions waiting for typed input keep the full timeout; menus expire sooner
+SESSION_TTL_BY_ACTION = {
+    "main_menu": 120,
+    "view_bot": 180,
+    "confirm_delete": 180,
+    "edit_bot": 300,
+    "edit_field": CONFIG_TIMEOUT,
+    "add_field": CONFIG_TIMEOUT,
+    "add_field_value": CONFIG_TIMEOUT,
+    "add_bot_name": CONFIG_TIMEOUT,
+    "add_bot_config": CONFIG_TIMEOUT,
+}
+# Between these session counts every TTL shrinks linearly, down to 20%
+SESSION_PRESSURE_LOW = 50
+SESSION_PRESSURE_HIGH = 200
 MAX_BUTTONS_PER_ROW = 3
 PAGE_SIZE = 8  # Number of bots to show per page
+SAVE_DEBOUNCE = 0.5  # Seconds to coalesce config changes before writing them to disk
+PRETTY_JSON_MIN_LENGTH = 80  # Longer object values are shown indented
+MENU_CACHE_SIZE = 256  # Per-bot menus kept by the lru caches below
+# Edit menus show as many fields as fit in both limits and page through the rest
+MAX_FIELDS_PER_PAGE = 24
+EDIT_MENU_BUDGET = 4096  # Estimated serialized bytes of the field buttons per page
+BUTTON_OVERHEAD = 32  # JSON keys and punctuation around each button's text and data
 
-# Active editor sessions: {user_id: session_data}
+# Case-insensitive booleans; json.loads only accepts lowercase ones
+_BOOL_WORDS = {"true": True, "false": False}
+# Bare numbers json.loads rejects, such as "007", ".5" and "5."
+_LOOSE_NUMBER_RE = re.compile(r"\A(?:\d+|\d*\.\d+|\d+\.)\Z", re.ASCII)
+
+# Bot and field names: ASCII letters, digits and underscores
+_IDENT_RE = re.compile(r"\A\w+\Z", re.ASCII)
+
+# dataclass(slots=True) needs Python 3.10; older interpreters get a plain dataclass
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Button labels shared by the menus
+BACK_LABEL = "◀️ Back"
+CLOSE_LABEL = "❌ Close"
+
+# Callback data is "c|<code>|<payload>". One-character action codes keep
+# buttons well under Telegram's 64-byte limit, and handlers take the payload
+# whole, so bot names may contain underscores
+CALLBACK_PREFIX = "c|"
+_ACTION_CODES = {
+    "main": "m",
+    "refresh": "r",
+    "close": "x",
+    "page": "p",
+    "view": "v",
+    "edit": "e",
+    "edit_field": "f",
+    "fields": "F",
+    "delete": "d",
+    "confirm_delete": "D",
+    "add_field": "a",
+    "add_new": "n",
+    "save": "s",
+    "noop": "z",
+}
+
+def config_callback(action: str, payload: str = "") -> str:
+    """Build the callback data of a config editor button."""
+    return f"{CALLBACK_PREFIX}{_ACTION_CODES[action]}|{payload}"
+
+# OWNER_USERID and SUDO_USERID are frozensets; merge them once so the
+# authorization check is a single hash lookup
+_AUTHORIZED_IDS = OWNER_USERID | SUDO_USERID
+
+@dataclass(**_SLOTS)
+class ConfigSession:
+    """State of one user's config editor session."""
+    timestamp: float
+    current_action: str = "main_menu"
+    data: Dict[str, Any] = field(default_factory=dict)
+    message_id: Optional[int] = None
+    chat_id: Optional[int] = None
+
+# Active editor sessions: {user_id: ConfigSession}, kept in order of last
+# activity (touch_session moves a session to the end) so the oldest come first
 active_sessions = {}
 
 # Get config manager instance
 config_manager = get_config_manager()
 
+# Pending debounced save, and a lock so executor writes land in order
+_save_task: Optional[asyncio.Task] = None
+_save_lock = asyncio.Lock()
+
+# (text, markup) last sent to each editor message, keyed by (chat id,
+# message id) so edits from any session or path see the same state
+_last_rendered: Dict[Tuple[int, int], tuple] = {}
+RENDER_CACHE_SIZE = 256
+
+# Sorted bot names for the main menu, rebuilt when config_manager.version moves
+_sorted_bot_names: List[str] = []
+_sorted_bot_names_version = -1
+
 # Helper Functions
 def is_authorized(user_id: int) -> bool:
     """Check if a user ID is authorized to use the config editor."""
-    if SUDO_USERID is None:
-        sudo_users = []
-    elif isinstance(SUDO_USERID, list):
-        sudo_users = SUDO_USERID
-    else:
-        sudo_users = [SUDO_USERID]
-    
-    # Ensure OWNER_USERID is valid
-    owner_id = OWNER_USERID if OWNER_USERID is not None else 0
+    return user_id in _AUTHORIZED_IDS
     
-    authorized_users = [owner_id] + sudo_users
-    return user_id in authorized_users
+
+def get_sorted_bot_names() -> List[str]:
+    """Get the configured bot names in sorted order, re-sorting only after a config change."""
+    global _sorted_bot_names, _sorted_bot_names_version
     
+    # get_all_bots also picks up on-disk changes when auto_reload is on
+    all_bots = config_manager.get_all_bots()
+    if config_manager.version != _sorted_bot_names_version:
+        _sorted_bot_names = sorted(all_bots)
+        _sorted_bot_names_version = config_manager.version
+    return _sorted_bot_names
 
 def get_main_menu(page: int = 0) -> InlineKeyboardMarkup:
     """Generate the main config menu with pagination."""
-    all_bots = config_manager.get_all_bots()
-    bot_names = sorted(list(all_bots.keys()))
+    bot_names = get_sorted_bot_names()
     
     # Paginate the bot list
     total_pages = max(1, (len(bot_names) + PAGE_SIZE - 1) // PAGE_SIZE)
+    # The remembered page may be past the end after bots were removed
+    page = min(max(page, 0), total_pages - 1)
     start_idx = page * PAGE_SIZE
     end_idx = min(start_idx + PAGE_SIZE, len(bot_names))
     current_page_bots = bot_names[start_idx:end_idx]
@@ -67,7 +163,7 @@ def get_main_menu(page: int = 0) -> InlineKeyboardMarkup:
             row.append(
                 InlineKeyboardButton(
                     bot_name, 
-                    callback_data=f"config_view_{bot_name}"
+                    callback_data=config_callback("view", bot_name)
                 )
             )
         keyboard.append(row)
@@ -75,96 +171,159 @@ def get_main_menu(page: int = 0) -> InlineKeyboardMarkup:
     # Add navigation and action buttons
     nav_row = []
     if page > 0:
-        nav_row.append(InlineKeyboardButton("◀️ Prev", callback_data=f"config_page_{page-1}"))
+        nav_row.append(InlineKeyboardButton("◀️ Prev", callback_data=config_callback("page", str(page - 1))))
     
-    nav_row.append(InlineKeyboardButton(f"📄 {page+1}/{total_pages}", callback_data="config_noop"))
+    nav_row.append(InlineKeyboardButton(f"📄 {page+1}/{total_pages}", callback_data=config_callback("noop")))
     
     if page < total_pages - 1:
-        nav_row.append(InlineKeyboardButton("Next ▶️", callback_data=f"config_page_{page+1}"))
+        nav_row.append(InlineKeyboardButton("Next ▶️", callback_data=config_callback("page", str(page + 1))))
     
     if nav_row:
         keyboard.append(nav_row)
     
     # Add action buttons
     keyboard.append([
-        InlineKeyboardButton("➕ Add Bot", callback_data="config_add_new"),
-        InlineKeyboardButton("🔄 Refresh", callback_data="config_refresh")
+        InlineKeyboardButton("➕ Add Bot", callback_data=config_callback("add_new")),
+        InlineKeyboardButton("🔄 Refresh", callback_data=config_callback("refresh"))
     ])
     
     keyboard.append([
-        InlineKeyboardButton("❌ Close", callback_data="config_close")
+        InlineKeyboardButton(CLOSE_LABEL, callback_data=config_callback("close"))
     ])
     
     return InlineKeyboardMarkup(keyboard)
 
+@functools.lru_cache(maxsize=MENU_CACHE_SIZE)
 def get_bot_menu(bot_name: str) -> InlineKeyboardMarkup:
-    """Generate the menu for a specific bot."""
+    """Generate the menu for a specific bot. The markup is shared; don't mutate it."""
     keyboard = [
         [
-            InlineKeyboardButton("✏️ Edit Config", callback_data=f"config_edit_{bot_name}"),
-            InlineKeyboardButton("🗑️ Delete Bot", callback_data=f"config_delete_{bot_name}")
+            InlineKeyboardButton("✏️ Edit Config", callback_data=config_callback("edit", bot_name)),
+            InlineKeyboardButton("🗑️ Delete Bot", callback_data=config_callback("delete", bot_name))
         ],
         [
-            InlineKeyboardButton("◀️ Back", callback_data="config_main"),
-            InlineKeyboardButton("❌ Close", callback_data="config_close")
+            InlineKeyboardButton(BACK_LABEL, callback_data=config_callback("main")),
+            InlineKeyboardButton(CLOSE_LABEL, callback_data=config_callback("close"))
         ]
     ]
     return InlineKeyboardMarkup(keyboard)
 
+@functools.lru_cache(maxsize=MENU_CACHE_SIZE)
 def get_confirm_delete_menu(bot_name: str) -> InlineKeyboardMarkup:
-    """Generate the confirmation menu for bot deletion."""
+    """Generate the confirmation menu for bot deletion. The markup is shared; don't mutate it."""
     keyboard = [
         [
-            InlineKeyboardButton("✅ Yes, Delete", callback_data=f"config_confirm_delete_{bot_name}"),
-            InlineKeyboardButton("❌ No, Cancel", callback_data=f"config_view_{bot_name}")
+            InlineKeyboardButton("✅ Yes, Delete", callback_data=config_callback("confirm_delete", bot_name)),
+            InlineKeyboardButton("❌ No, Cancel", callback_data=config_callback("view", bot_name))
         ]
     ]
     return InlineKeyboardMarkup(keyboard)
 
-def get_edit_menu(bot_name: str) -> InlineKeyboardMarkup:
-    """Generate the edit menu for a bot's configuration."""
+def get_edit_menu(bot_name: str, start: int = 0) -> InlineKeyboardMarkup:
+    """Generate the edit menu for a bot's configuration, starting at field `start`."""
+    # get_bot_config picks up on-disk changes before the version is read
+    config_manager.get_bot_config(bot_name)
+    return _build_edit_menu(bot_name, config_manager.version, start)
+
+def _field_button(bot_name: str, key: str, value: Any) -> InlineKeyboardButton:
+    """Build the edit button of one field."""
+    # Truncate value for display if needed
+    display_value = str(value)
+    if len(display_value) > 15:
+        display_value = display_value[:12] + "..."
+    
+    return InlineKeyboardButton(
+        f"{key}: {display_value}", 
+        callback_data=config_callback("edit_field", f"{bot_name}|{key}")
+    )
+
+@functools.lru_cache(maxsize=MENU_CACHE_SIZE)
+def _field_buttons(bot_name: str, version: int):
+    """
+    Build the field buttons of a bot as of config `version`.
+    
+    Returns:
+        tuple: The buttons sorted by field name, and the running totals of
+            their estimated serialized sizes (sizes[i] covers buttons[:i])
+    """
+    bot_config = config_manager.get_bot_config(bot_name) or {}
+    buttons = [
+        _field_button(bot_name, key, value)
+        for key, value in sorted(bot_config.items())
+        if key != "name"  # Skip the name field added by get_bot_config
+    ]
+    sizes = [0]
+    sizes.extend(itertools.accumulate(
+        len(b.text.encode()) + len(b.callback_data.encode()) + BUTTON_OVERHEAD
+        for b in buttons
+    ))
+    return buttons, sizes
+
+def _fit_page(sizes: List[int], start: int) -> int:
+    """Return the end of the largest page of field buttons from `start` that fits."""
+    # sizes is non-decreasing, so bisect finds the last end within budget
+    end = bisect.bisect_right(sizes, sizes[start] + EDIT_MENU_BUDGET, lo=start) - 1
+    # Always show at least one field so a huge value cannot stall the cursor
+    return max(start + 1, min(end, start + MAX_FIELDS_PER_PAGE, len(sizes) - 1))
+
+def _fit_page_before(sizes: List[int], end: int) -> int:
+    """Return the start of the largest page of field buttons ending at `end` that fits."""
+    start = bisect.bisect_left(sizes, sizes[end] - EDIT_MENU_BUDGET, hi=end)
+    return max(0, min(start, end - 1), end - MAX_FIELDS_PER_PAGE)
+
+@functools.lru_cache(maxsize=MENU_CACHE_SIZE)
+def _build_edit_menu(bot_name: str, version: int, start: int = 0) -> InlineKeyboardMarkup:
+    """Build the edit menu of a bot as of config `version`, starting at field `start`."""
     bot_config = config_manager.get_bot_config(bot_name)
     if not bot_config:
         return get_main_menu()
     
+    buttons, sizes = _field_buttons(bot_name, version)
     keyboard = []
-    
-    # Add fields as buttons
-    for key, value in bot_config.items():
-        if key == "name":  # Skip the name field added by get_bot_config
-            continue
-        
-        # Truncate value for display if needed
-        display_value = str(value)
-        if len(display_value) > 15:
-            display_value = display_value[:12] + "..."
+    if buttons:
+        start = min(max(start, 0), len(buttons) - 1)
+        end = _fit_page(sizes, start)
+        keyboard.extend([button] for button in buttons[start:end])
         
-        keyboard.append([
-            InlineKeyboardButton(
-                f"{key}: {display_value}", 
-                callback_data=f"config_edit_field_{bot_name}_{key}"
-            )
-        ])
+        nav_row = []
+        if start > 0:
+            prev_start = _fit_page_before(sizes, start)
+            nav_row.append(InlineKeyboardButton(
+                "← Previous fields", callback_data=config_callback("fields", f"{prev_start}|{bot_name}")
+            ))
+        if end < len(buttons):
+            nav_row.append(InlineKeyboardButton(
+                "Next fields →", callback_data=config_callback("fields", f"{end}|{bot_name}")
+            ))
+        if nav_row:
+            keyboard.append(nav_row)
     
     # Add action buttons
     keyboard.append([
-        InlineKeyboardButton("➕ Add Field", callback_data=f"config_add_field_{bot_name}"),
+        InlineKeyboardButton("➕ Add Field", callback_data=config_callback("add_field", bot_name)),
     ])
     
     keyboard.append([
-        InlineKeyboardButton("💾 Save", callback_data=f"config_save_{bot_name}"),
-        InlineKeyboardButton("◀️ Back", callback_data=f"config_view_{bot_name}"),
+        InlineKeyboardButton("💾 Save", callback_data=config_callback("save", bot_name)),
+        InlineKeyboardButton(BACK_LABEL, callback_data=config_callback("view", bot_name)),
     ])
     
     return InlineKeyboardMarkup(keyboard)
 
 def format_bot_config(bot_name: str) -> str:
     """Format a bot's configuration for display."""
+    # get_bot_config picks up on-disk changes before the version is read
+    config_manager.get_bot_config(bot_name)
+    return _format_bot_config(bot_name, config_manager.version)
+
+@functools.lru_cache(maxsize=MENU_CACHE_SIZE)
+def _format_bot_config(bot_name: str, version: int) -> str:
+    """Format a bot's configuration as of config `version`."""
     bot_config = config_manager.get_bot_config(bot_name)
     if not bot_config:
         return f"⚠️ Bot '{bot_name}' not found!"
     
-    text = f"🤖 **Bot Configuration: {bot_name}**\n\n"
+    parts = [f"🤖 **Bot Configuration: {bot_name}**\n\n"]
     
     # Format each field
     for key, value in sorted(bot_config.items()):
@@ -172,22 +331,73 @@ def format_bot_config(bot_name: str) -> str:
             continue
         
         # Format based on type
-        if isinstance(value, dict):
-            text += f"**{key}**: `{json.dumps(value, indent=2)}`\n"
-        elif isinstance(value, list):
-            text += f"**{key}**: `{json.dumps(value)}`\n"
-        else:
-            text += f"**{key}**: `{value}`\n"
-    
-    return text
+        if isinstance(value, (dict, list)):
+            text = json.dumps(value)
+            # Only spread objects over several lines when they are long
+            if isinstance(value, dict) and len(text) > PRETTY_JSON_MIN_LENGTH:
+                text = json.dumps(value, indent=2)
+            value = text
+        parts.append(f"**{key}**: `{value}`\n")
+    
+    return "".join(parts)
+
+def schedule_config_save():
+    """Write the config to disk shortly, coalescing changes made in the meantime."""
+    global _save_task
+    if _save_task is None or _save_task.done():
+        _save_task = asyncio.get_running_loop().create_task(_flush_config())
+
+async def _flush_config():
+    """Wait out the debounce window, then save off the event loop."""
+    global _save_task
+    await asyncio.sleep(SAVE_DEBOUNCE)
+    # Changes made from here on schedule a new save
+    _save_task = None
+    async with _save_lock:
+        await asyncio.get_running_loop().run_in_executor(None, config_manager.save_config)
+
+async def flush_config_save():
+    """Write a pending debounced save now instead of after SAVE_DEBOUNCE; main() awaits this on shutdown."""
+    global _save_task
+    task, _save_task = _save_task, None
+    pending = task is not None and not task.done()
+    if pending:
+        task.cancel()
+    # Taking the lock also waits out a save that is already being written
+    async with _save_lock:
+        if pending:
+            await asyncio.get_running_loop().run_in_executor(None, config_manager.save_config)
+
+def touch_session(user_id: int) -> Optional[ConfigSession]:
+    """Refresh a session's timestamp and move it to the end of active_sessions."""
+    session = active_sessions.pop(user_id, None)
+    if session is not None:
+        session.timestamp = time.time()
+        active_sessions[user_id] = session
+    return session
 
 def cleanup_expired_sessions():
-    """Remove expired editor sessions."""
-    current_time = time.time()
-    expired_keys = [
-        user_id for user_id, session in active_sessions.items()
-        if current_time - session.get("timestamp", 0) > CONFIG_TIMEOUT
-    ]
+    """
+    Remove expired editor sessions.
+    
+    Each session's TTL depends on what it is waiting for and shrinks as
+    the number of sessions grows. active_sessions is ordered by last
+    activity, so the scan stops at the first session younger than the
+    shortest TTL.
+    """
+    pressure = (len(active_sessions) - SESSION_PRESSURE_LOW) / (SESSION_PRESSURE_HIGH - SESSION_PRESSURE_LOW)
+    scale = 1 - 0.8 * min(1.0, max(0.0, pressure))
+    min_ttl = min(SESSION_TTL_BY_ACTION.values()) * scale
+    
+    now = time.time()
+    expired_keys = []
+    for user_id, session in active_sessions.items():
+        age = now - session.timestamp
+        if age < min_ttl:
+            break
+        ttl = SESSION_TTL_BY_ACTION.get(session.current_action, CONFIG_TIMEOUT) * scale
+        if age > ttl:
+            expired_keys.append(user_id)
     
     for user_id in expired_keys:
         del active_sessions[user_id]
@@ -196,21 +406,38 @@ def parse_value(value_str: str) -> Any:
     """Parse a string value into appropriate Python type."""
     value_str = value_str.strip()
     
+    boolean = _BOOL_WORDS.get(value_str.lower())
+    if boolean is not None:
+        return boolean
+    
     try:
-        # Try to parse as JSON first
+        # JSON covers objects, arrays, numbers, quoted strings and null
         return json.loads(value_str)
     except json.JSONDecodeError:
-        # Handle other value types
-        if value_str.lower() == "true":
-            return True
-        elif value_str.lower() == "false":
-            return False
-        elif value_str.isdigit():
-            return int(value_str)
-        elif value_str.replace(".", "", 1).isdigit() and value_str.count(".") == 1:
-            return float(value_str)
-        else:
-            return value_str  # Keep as string
+        if _LOOSE_NUMBER_RE.match(value_str):
+            return float(value_str) if "." in value_str else int(value_str)
+        return value_str  # Keep as string
+
+async def send_config_response(message: Message, session: ConfigSession, text: str, reply_markup=None):
+    """
+    Answer a config editor message. Private chats get a reply; in groups the
+    session's editor message is edited, falling back to a reply.
+    """
+    # The editor message is about to change outside edit_config_message
+    _last_rendered.pop((session.chat_id, session.message_id), None)
+    if (message.chat.type != ChatType.PRIVATE and session.message_id
+            and session.chat_id == message.chat.id):
+        try:
+            return await bot.edit_message_text(
+                message.chat.id,
+                session.message_id,
+                text,
+                reply_markup=reply_markup,
+                parse_mode=ParseMode.MARKDOWN
+            )
+        except Exception as e:
+            logger.error("Error editing message: %s", e)
+    return await message.reply(text, reply_markup=reply_markup, parse_mode=ParseMode.MARKDOWN)
 
 async def handle_unauthorized(message: Message) -> bool:
     """Handle unauthorized access attempt."""
@@ -230,14 +457,9 @@ async def config_command(_, message: Message):
     if await handle_unauthorized(message):
         return
     
-    # Start a new config session
-    active_sessions[user_id] = {
-        "timestamp": time.time(),
-        "current_action": "main_menu",
-        "data": {},
-        "message_id": None,
-        "chat_id": message.chat.id
-    }
+    # Start a new config session, replacing any old one
+    active_sessions.pop(user_id, None)
+    active_sessions[user_id] = ConfigSession(timestamp=time.time(), chat_id=message.chat.id)
     
     # Send the main menu
     response = await message.reply(
@@ -247,10 +469,216 @@ async def config_command(_, message: Message):
     )
     
     # Store the message ID for future updates
-    active_sessions[user_id]["message_id"] = response.id
+    active_sessions[user_id].message_id = response.id
 
 # Callback query handlers
-@bot.on_callback_query(filters.regex("^config_"))
+MAIN_MENU_TEXT = (
+    "🛠️ **Bot Configuration Manager**\n\n"
+    "Select a bot to view or edit its configuration:"
+)
+
+async def edit_config_message(callback: CallbackQuery, session: ConfigSession, text: str,
+                              reply_markup: Optional[InlineKeyboardMarkup] = None, parse_mode=None):
+    """Edit the editor message, skipping the request if it already shows this content."""
+    key = (callback.message.chat.id, callback.message.id)
+    rendered = (text, reply_markup)
+    if _last_rendered.get(key) == rendered:
+        return
+    try:
+        await callback.edit_message_text(text, reply_markup=reply_markup, parse_mode=parse_mode)
+    except MessageNotModified:
+        pass
+    # Re-insert so the dict stays in order of last edit and the oldest is dropped first
+    _last_rendered.pop(key, None)
+    _last_rendered[key] = rendered
+    if len(_last_rendered) > RENDER_CACHE_SIZE:
+        del _last_rendered[next(iter(_last_rendered))]
+
+def current_main_menu(session: ConfigSession) -> InlineKeyboardMarkup:
+    """The main menu on the page the session last looked at."""
+    return get_main_menu(session.data.get("page", 0))
+
+async def _cb_main(callback: CallbackQuery, session: ConfigSession, payload: str):
+    """Show the main menu."""
+    await edit_config_message(callback, session, MAIN_MENU_TEXT, reply_markup=current_main_menu(session))
+    session.current_action = "main_menu"
+
+async def _cb_refresh(callback: CallbackQuery, session: ConfigSession, payload: str):
+    """Reload the config from disk and show the main menu."""
+    config_manager.reload_config()
+    await callback.answer("✅ Configuration reloaded successfully!")
+    await edit_config_message(callback, session, MAIN_MENU_TEXT, reply_markup=current_main_menu(session))
+
+async def _cb_close(callback: CallbackQuery, session: ConfigSession, payload: str):
+    """Close the config editor."""
+    await callback.edit_message_text("❌ Configuration manager closed.")
+    active_sessions.pop(callback.from_user.id, None)
+
+async def _cb_page(callback: CallbackQuery, session: ConfigSession, payload: str):
+    """Show a page of the main menu."""
+    page = int(payload)
+    session.data["page"] = page
+    await edit_config_message(callback, session, MAIN_MENU_TEXT, reply_markup=get_main_menu(page))
+
+async def _cb_view(callback: CallbackQuery, session: ConfigSession, bot_name: str):
+    """View a bot's config."""
+    await edit_config_message(
+        callback, session,
+        format_bot_config(bot_name),
+        reply_markup=get_bot_menu(bot_name),
+        parse_mode=ParseMode.MARKDOWN
+    )
+    session.current_action = "view_bot"
+    session.data["bot_name"] = bot_name
+
+async def _cb_edit(callback: CallbackQuery, session: ConfigSession, bot_name: str):
+    """Show a bot's fields."""
+    await edit_config_message(
+        callback, session,
+        f"✏️ **Editing Bot: {bot_name}**\n\n"
+        "Select a field to edit or add a new field:",
+        reply_markup=get_edit_menu(bot_name),
+        parse_mode=ParseMode.MARKDOWN
+    )
+    session.current_action = "edit_bot"
+    session.data["bot_name"] = bot_name
+
+async def _cb_edit_field(callback: CallbackQuery, session: ConfigSession, payload: str):
+    """Prompt for a new value of one field; the payload is "<bot_name>|<field_name>"."""
+    bot_name, _, field_name = payload.rpartition("|")
+    
+    session.current_action = "edit_field"
+    session.data["bot_name"] = bot_name
+    session.data["field_name"] = field_name
+    
+    bot_config = config_manager.get_bot_config(bot_name) or {}
+    current_value = bot_config.get(field_name, "")
+    
+    await edit_config_message(
+        callback, session,
+        f"🔄 **Editing '{field_name}' for bot '{bot_name}'**\n\n"
+        f"Current value: `{current_value}`\n\n"
+        "Please send a new value for this field. Send:\n"
+        "- JSON for objects and arrays\n"
+        "- Plain text for strings\n"
+        "- Number for numeric values\n"
+        "- 'true' or 'false' for booleans\n\n"
+        "Type /cancel to cancel editing.",
+        parse_mode=ParseMode.MARKDOWN
+    )
+
+async def _cb_delete(callback: CallbackQuery, session: ConfigSession, bot_name: str):
+    """Ask for confirmation before deleting a bot."""
+    await edit_config_message(
+        callback, session,
+        f"⚠️ **Are you sure you want to delete bot '{bot_name}'?**\n\n"
+        "This action cannot be undone.",
+        reply_markup=get_confirm_delete_menu(bot_name),
+        parse_mode=ParseMode.MARKDOWN
+    )
+    session.current_action = "confirm_delete"
+    session.data["bot_name"] = bot_name
+
+async def _cb_confirm_delete(callback: CallbackQuery, session: ConfigSession, bot_name: str):
+    """Delete a bot after confirmation."""
+    success = config_manager.remove_bot_config(bot_name)
+    
+    if success:
+        schedule_config_save()
+        # The toast and the edit are independent requests; send them together
+        await asyncio.gather(
+            callback.answer(f"✅ Bot '{bot_name}' deleted successfully!"),
+            edit_config_message(callback, session, MAIN_MENU_TEXT, reply_markup=current_main_menu(session))
+        )
+        session.current_action = "main_menu"
+    else:
+        await callback.answer(f"❌ Failed to delete bot '{bot_name}'!", show_alert=True)
+
+async def _cb_add_new(callback: CallbackQuery, session: ConfigSession, payload: str):
+    """Start adding a new bot."""
+    session.current_action = "add_bot_name"
+    
+    await edit_config_message(
+        callback, session,
+        "➕ **Adding a new bot**\n\n"
+        "Please send the bot name.\n\n"
+        "Type /cancel to cancel.",
+        parse_mode=ParseMode.MARKDOWN
+    )
+
+async def _cb_add_field(callback: CallbackQuery, session: ConfigSession, bot_name: str):
+    """Start adding a new field to a bot."""
+    session.current_action = "add_field"
+    session.data["bot_name"] = bot_name
+    
+    await edit_config_message(
+        callback, session,
+        f"➕ **Adding a new field to bot '{bot_name}'**\n\n"
+        "Please send the field name.\n\n"
+        "Type /cancel to cancel.",
+        parse_mode=ParseMode.MARKDOWN
+    )
+
+async def _cb_save(callback: CallbackQuery, session: ConfigSession, bot_name: str):
+    """Save the config to disk and show the bot again."""
+    async with _save_lock:
+        success = await asyncio.get_running_loop().run_in_executor(None, config_manager.save_config)
+    
+    if success:
+        await asyncio.gather(
+            callback.answer("✅ Configuration saved successfully!"),
+            edit_config_message(
+                callback, session,
+                format_bot_config(bot_name),
+                reply_markup=get_bot_menu(bot_name),
+                parse_mode=ParseMode.MARKDOWN
+            )
+        )
+        session.current_action = "view_bot"
+    else:
+        await callback.answer("❌ Failed to save configuration!", show_alert=True)
+
+async def _cb_fields(callback: CallbackQuery, session: ConfigSession, payload: str):
+    """Show another page of a bot's fields; the payload is "<start>|<bot_name>"."""
+    start, _, bot_name = payload.partition("|")
+    await edit_config_message(
+        callback, session,
+        f"✏️ **Editing Bot: {bot_name}**\n\n"
+        "Select a field to edit or add a new field:",
+        reply_markup=get_edit_menu(bot_name, int(start)),
+        parse_mode=ParseMode.MARKDOWN
+    )
+    session.current_action = "edit_bot"
+    session.data["bot_name"] = bot_name
+
+async def _cb_noop(callback: CallbackQuery, session: ConfigSession, payload: str):
+    """No operation (used for page number display); the dispatcher already answered."""
+
+# Handlers get the payload of the callback data built by config_callback
+CALLBACK_HANDLERS = {
+    "main": _cb_main,
+    "refresh": _cb_refresh,
+    "close": _cb_close,
+    "page": _cb_page,
+    "view": _cb_view,
+    "edit": _cb_edit,
+    "edit_field": _cb_edit_field,
+    "fields": _cb_fields,
+    "delete": _cb_delete,
+    "confirm_delete": _cb_confirm_delete,
+    "add_field": _cb_add_field,
+    "add_new": _cb_add_new,
+    "save": _cb_save,
+    "noop": _cb_noop,
+}
+_HANDLERS_BY_CODE = {_ACTION_CODES[action]: handler for action, handler in CALLBACK_HANDLERS.items()}
+
+# Actions whose handlers answer the callback themselves with a toast or an
+# alert; every other callback is answered as soon as it arrives
+SELF_ANSWERING_ACTIONS = frozenset({"refresh", "confirm_delete", "save"})
+_SELF_ANSWERING_CODES = frozenset(_ACTION_CODES[action] for action in SELF_ANSWERING_ACTIONS)
+
+@bot.on_callback_query(filters.regex(f"^{re.escape(CALLBACK_PREFIX)}"))
 async def config_callback_handler(_, callback: CallbackQuery):
     """Handle all configuration-related callbacks."""
     user_id = callback.from_user.id
@@ -262,199 +690,62 @@ async def config_callback_handler(_, callback: CallbackQuery):
     
     # Initialize or update the session
     if user_id not in active_sessions:
-        active_sessions[user_id] = {
-            "timestamp": time.time(),
-            "current_action": "main_menu",
-            "data": {},
-            "message_id": callback.message.id,
-            "chat_id": callback.message.chat.id
-        }
+        active_sessions[user_id] = ConfigSession(
+            timestamp=time.time(),
+            message_id=callback.message.id,
+            chat_id=callback.message.chat.id
+        )
     else:
-        active_sessions[user_id]["timestamp"] = time.time()
-        active_sessions[user_id]["message_id"] = callback.message.id
-        active_sessions[user_id]["chat_id"] = callback.message.chat.id
+        session = touch_session(user_id)
+        session.message_id = callback.message.id
+        session.chat_id = callback.message.chat.id
     
     session = active_sessions[user_id]
     cleanup_expired_sessions()
     
     # Handle different callback actions
+    code, _, payload = query_data[len(CALLBACK_PREFIX):].partition("|")
+    handler = _HANDLERS_BY_CODE.get(code)
+    if handler is None:
+        # Unknown callback
+        return await callback.answer("⚠️ Unknown action!", show_alert=True)
+    
+    # Stop the client's loading spinner before doing any work
+    answered = code not in _SELF_ANSWERING_CODES
+    if answered:
+        await callback.answer()
+    
     try:
-        if query_data == "config_main":
-            # Main menu
-            await callback.edit_message_text(
-                "🛠️ **Bot Configuration Manager**\n\n"
-                "Select a bot to view or edit its configuration:",
-                reply_markup=get_main_menu()
-            )
-            session["current_action"] = "main_menu"
-            
-        elif query_data == "config_refresh":
-            # Refresh the config
-            config_manager.reload_config()
-            await callback.answer("✅ Configuration reloaded successfully!")
-            await callback.edit_message_text(
-                "🛠️ **Bot Configuration Manager**\n\n"
-                "Select a bot to view or edit its configuration:",
-                reply_markup=get_main_menu()
-            )
-            
-        elif query_data == "config_close":
-            # Close the config editor
-            await callback.edit_message_text("❌ Configuration manager closed.")
-            if user_id in active_sessions:
-                del active_sessions[user_id]
-                
-        elif query_data.startswith("config_page_"):
-            # Pagination
-            page = int(query_data.split("_")[-1])
-            await callback.edit_message_text(
-                "🛠️ **Bot Configuration Manager**\n\n"
-                "Select a bot to view or edit its configuration:",
-                reply_markup=get_main_menu(page)
-            )
-            
-        elif query_data.startswith("config_view_"):
-            # View bot config
-            bot_name = query_data[12:]
-            await callback.edit_message_text(
-                format_bot_config(bot_name),
-                reply_markup=get_bot_menu(bot_name),
-                parse_mode=ParseMode.MARKDOWN
-            )
-            session["current_action"] = "view_bot"
-            session["data"]["bot_name"] = bot_name
-            
-        elif query_data.startswith("config_edit_"):
-            # Edit bot config
-            if query_data.startswith("config_edit_field_"):
-                # Edit specific field
-                parts = query_data.split("_")
-                bot_name = parts[3]
-                field_name = parts[4]
-                
-                session["current_action"] = "edit_field"
-                session["data"]["bot_name"] = bot_name
-                session["data"]["field_name"] = field_name
-                
-                bot_config = config_manager.get_bot_config(bot_name)
-                current_value = bot_config.get(field_name, "")
-                
-                await callback.edit_message_text(
-                    f"🔄 **Editing '{field_name}' for bot '{bot_name}'**\n\n"
-                    f"Current value: `{current_value}`\n\n"
-                    "Please send a new value for this field. Send:\n"
-                    "- JSON for objects and arrays\n"
-                    "- Plain text for strings\n"
-                    "- Number for numeric values\n"
-                    "- 'true' or 'false' for booleans\n\n"
-                    "Type /cancel to cancel editing.",
-                    parse_mode=ParseMode.MARKDOWN
-                )
-                
-            else:
-                # Edit bot (show all fields)
-                bot_name = query_data.split("_")[-1]
-                await callback.edit_message_text(
-                    f"✏️ **Editing Bot: {bot_name}**\n\n"
-                    "Select a field to edit or add a new field:",
-                    reply_markup=get_edit_menu(bot_name),
-                    parse_mode=ParseMode.MARKDOWN
-                )
-                session["current_action"] = "edit_bot"
-                session["data"]["bot_name"] = bot_name
-                
-        elif query_data.startswith("config_delete_"):
-            # Delete bot confirmation
-            bot_name = query_data[14:]
-            await callback.edit_message_text(
-                f"⚠️ **Are you sure you want to delete bot '{bot_name}'?**\n\n"
-                "This action cannot be undone.",
-                reply_markup=get_confirm_delete_menu(bot_name),
-                parse_mode=ParseMode.MARKDOWN
-            )
-            session["current_action"] = "confirm_delete"
-            session["data"]["bot_name"] = bot_name
-            
-        elif query_data.startswith("config_confirm_delete_"):
-            # Execute bot deletion
-            bot_name = query_data[21:]
-            success = config_manager.remove_bot_config(bot_name)
-            
-            if success:
-                config_manager.save_config()
-                await callback.answer(f"✅ Bot '{bot_name}' deleted successfully!")
-                await callback.edit_message_text(
-                    "🛠️ **Bot Configuration Manager**\n\n"
-                    "Select a bot to view or edit its configuration:",
-                    reply_markup=get_main_menu()
-                )
-                session["current_action"] = "main_menu"
-            else:
-                await callback.answer(f"❌ Failed to delete bot '{bot_name}'!", show_alert=True)
-                
-        elif query_data.startswith("config_add_field_"):
-            # Add a new field to bot
-            bot_name = query_data[17:]
-            
-            session["current_action"] = "add_field"
-            session["data"]["bot_name"] = bot_name
-            
-            await callback.edit_message_text(
-                f"➕ **Adding a new field to bot '{bot_name}'**\n\n"
-                "Please send the field name.\n\n"
-                "Type /cancel to cancel.",
-                parse_mode=ParseMode.MARKDOWN
-            )
-            
-        elif query_data.startswith("config_save_"):
-            # Save bot config
-            bot_name = query_data[12:]
-            success = config_manager.save_config()
-            
-            if success:
-                await callback.answer("✅ Configuration saved successfully!")
-                await callback.edit_message_text(
-                    format_bot_config(bot_name),
-                    reply_markup=get_bot_menu(bot_name),
-                    parse_mode=ParseMode.MARKDOWN
-                )
-                session["current_action"] = "view_bot"
-            else:
-                await callback.answer("❌ Failed to save configuration!", show_alert=True)
-                
-        elif query_data == "config_add_new":
-            # Add a new bot
-            session["current_action"] = "add_bot_name"
-            
-            await callback.edit_message_text(
-                "➕ **Adding a new bot**\n\n"
-                "Please send the bot name.\n\n"
-                "Type /cancel to cancel.",
-                parse_mode=ParseMode.MARKDOWN
-            )
-            
-        elif query_data == "config_noop":
-            # No operation (used for page number display)
-            await callback.answer()
-            
-        else:
-            # Unknown callback
-            await callback.answer("⚠️ Unknown action!", show_alert=True)
+        await handler(callback, session, payload)
             
     except Exception as e:
-        logger.error(f"Error handling callback: {e}", exc_info=True)
-        await callback.answer(f"❌ Error: {str(e)[:200]}", show_alert=True)
+        logger.error("Error handling callback: %s", e, exc_info=True)
+        error_text = f"❌ Error: {str(e)[:200]}"
+        if not answered:
+            await callback.answer(error_text, show_alert=True)
+        else:
+            # The callback can only be answered once, so report the failure
+            # in the chat instead of leaving the button looking inert
+            try:
+                await callback.message.reply(error_text)
+            except Exception as reply_error:
+                logger.error("Error reporting callback failure: %s", reply_error)
 
 # Message filter for catching configuration input
 def config_filter(_, __, message):
-    """Filter messages for the config editor."""
+    """
+    Filter messages for the config editor.
+    
+    Pyrogram runs synchronous filters in an executor thread, so this only
+    reads active_sessions; handle_config_message touches the session on
+    the event loop.
+    """
     if not message.from_user:
         return False
-        
-    user_id = message.from_user.id
     
     # Only process messages from users with active sessions
-    if user_id not in active_sessions:
+    session = active_sessions.get(message.from_user.id)
+    if session is None:
         return False
     
     # Skip command messages except /cancel
@@ -463,9 +754,7 @@ def config_filter(_, __, message):
     
     # Don't process messages in groups unless it's a reply to the bot's message
     if message.chat.type != ChatType.PRIVATE:
-        session = active_sessions.get(user_id, {})
-        bot_message_id = session.get("message_id")
-        if not message.reply_to_message or message.reply_to_message.id != bot_message_id:
+        if not message.reply_to_message or message.reply_to_message.id != session.message_id:
             return False
     
     return True
@@ -474,97 +763,71 @@ def config_filter(_, __, message):
 @bot.on_message(filters.create(config_filter))
 async def handle_config_message(_, message: Message):
     """Handle messages for the config editor."""
-    user_id = message.from_user.id
-    
-    # Safety check for session existence
-    if user_id not in active_sessions:
+    # The session may have expired since config_filter saw it
+    session = touch_session(message.from_user.id)
+    if session is None:
         return
     
     # Check if message is /cancel
     if message.text and message.text.startswith('/cancel'):
         return await handle_cancel_command(_, message)
     
-    session = active_sessions[user_id]
-    session["timestamp"] = time.time()
-    
-    # Create a response function that works in both private and group chats
-    async def send_response(text, reply_markup=None):
-        if message.chat.type == ChatType.PRIVATE:
-            return await message.reply(text, reply_markup=reply_markup, parse_mode=ParseMode.MARKDOWN)
-        else:
-            # In groups, edit the original message or reply to it
-            if session.get("message_id"):
-                try:
-                    return await bot.edit_message_text(
-                        message.chat.id,
-                        session["message_id"],
-                        text,
-                        reply_markup=reply_markup,
-                        parse_mode=ParseMode.MARKDOWN
-                    )
-                except Exception as e:
-                    logger.error(f"Error editing message: {e}")
-                    return await message.reply(text, reply_markup=reply_markup, parse_mode=ParseMode.MARKDOWN)
-            else:
-                return await message.reply(text, reply_markup=reply_markup, parse_mode=ParseMode.MARKDOWN)
-    
     try:
-        if session["current_action"] == "edit_field":
+        if session.current_action == "edit_field":
             # Handle field editing
-            bot_name = session["data"]["bot_name"]
-            field_name = session["data"]["field_name"]
-            
-            # Get the current bot config
-            bot_config = config_manager.get_bot_config(bot_name).copy()
-            if "name" in bot_config:
-                del bot_config["name"]  # Remove name field added by get_bot_config
+            bot_name = session.data["bot_name"]
+            field_name = session.data["field_name"]
             
             # Parse the new value
             new_value = message.text.strip()
             try:
                 parsed_value = parse_value(new_value)
-                bot_config[field_name] = parsed_value
             except Exception as e:
-                return await send_response(
+                return await send_config_response(
+                    message, session,
                     f"⚠️ Error parsing value: {str(e)}\n\n"
                     "Please try again or type /cancel to cancel."
                 )
             
             # Update the configuration
-            success = config_manager.update_bot_config(bot_name, bot_config)
+            success = config_manager.update_bot_field(bot_name, field_name, parsed_value)
             
             if success:
                 # Return to the edit menu
-                response = await send_response(
+                response = await send_config_response(
+                    message, session,
                     f"✅ Field '{field_name}' updated successfully!",
                     reply_markup=get_edit_menu(bot_name)
                 )
                 if hasattr(response, 'id'):
-                    session["message_id"] = response.id
-                session["current_action"] = "edit_bot"
+                    session.message_id = response.id
+                session.current_action = "edit_bot"
             else:
-                await send_response(
+                await send_config_response(
+                    message, session,
                     f"❌ Failed to update field '{field_name}'!",
                     reply_markup=get_edit_menu(bot_name)
                 )
                 
-        elif session["current_action"] == "add_field":
+        elif session.current_action == "add_field":
             # Handle adding a new field (step 1: field name)
-            bot_name = session["data"]["bot_name"]
+            bot_name = session.data["bot_name"]
             field_name = message.text.strip()
             
             # Validate field name
-            if not re.match(r'^[a-zA-Z0-9_]+$', field_name):
-                return await send_response(
+            if not _IDENT_RE.match(field_name):
+                return await send_config_response(
+                    message, session,
                     "⚠️ Invalid field name. Use only letters, numbers, and underscores.\n\n"
                     "Please try again or type /cancel to cancel."
                 )
             
             # Store field name and ask for value
-            session["data"]["field_name"] = field_name
-            session["current_action"] = "add_field_value"
+            session.data["field_name"] = field_name
+            session.current_action = "add_field_value"
             
-            response = await send_response(
+            response = await send_config_response(
+                message, session,
                 f"👍 Field name '{field_name}' accepted.\n\n"
                 f"Now, please send the value for field '{field_name}'.\n\n"
                 "- JSON for objects and arrays\n"
@@ -574,70 +837,70 @@ async def handle_config_message(_, message: Message):
                 "Type /cancel to cancel."
             )
             if hasattr(response, 'id'):
-                session["message_id"] = response.id
+                session.message_id = response.id
             
-        elif session["current_action"] == "add_field_value":
+        elif session.current_action == "add_field_value":
             # Handle adding a new field (step 2: field value)
-            bot_name = session["data"]["bot_name"]
-            field_name = session["data"]["field_name"]
-            
-            # Get the current bot config
-            bot_config = config_manager.get_bot_config(bot_name).copy()
-            if "name" in bot_config:
-                del bot_config["name"]  # Remove name field added by get_bot_config
+            bot_name = session.data["bot_name"]
+            field_name = session.data["field_name"]
             
             # Parse the new value
             new_value = message.text.strip()
             try:
                 parsed_value = parse_value(new_value)
-                bot_config[field_name] = parsed_value
             except Exception as e:
-                return await send_response(
+                return await send_config_response(
+                    message, session,
                     f"⚠️ Error parsing value: {str(e)}\n\n"
                     "Please try again or type /cancel to cancel."
                 )
             
             # Update the configuration
-            success = config_manager.update_bot_config(bot_name, bot_config)
+            success = config_manager.update_bot_field(bot_name, field_name, parsed_value)
             
             if success:
                 # Return to the edit menu
-                response = await send_response(
+                response = await send_config_response(
+                    message, session,
                     f"✅ Field '{field_name}' added successfully!",
                     reply_markup=get_edit_menu(bot_name)
                 )
                 if hasattr(response, 'id'):
-                    session["message_id"] = response.id
-                session["current_action"] = "edit_bot"
+                    session.message_id = response.id
+                session.current_action = "edit_bot"
             else:
-                await send_response(
+                await send_config_response(
+                    message, session,
                     f"❌ Failed to add field '{field_name}'!",
                     reply_markup=get_edit_menu(bot_name)
                 )
                 
-        elif session["current_action"] == "add_bot_name":
+        elif session.current_action == "add_bot_name":
             # Handle adding a new bot (step 1: bot name)
             bot_name = message.text.strip()
             
             # Validate bot name
-            if not re.match(r'^[a-zA-Z0-9_]+$', bot_name):
-                return await send_response(
+            if not _IDENT_RE.match(bot_name):
+                return await send_config_response(
+                    message, session,
                     "⚠️ Invalid bot name. Use only letters, numbers, and underscores.\n\n"
                     "Please try again or type /cancel to cancel."
                 )
             
             # Check if bot already exists
             if config_manager.get_bot_config(bot_name):
-                return await send_response(
+                return await send_config_response(
+                    message, session,
                     f"⚠️ A bot with the name '{bot_name}' already exists.\n\n"
                     "Please choose a different name or type /cancel to cancel."
                 )
             
             # Store bot name and proceed to config creation
-            session["data"]["bot_name"] = bot_name
-            session["current_action"] = "add_bot_config"
+            session.data["bot_name"] = bot_name
+            session.current_action = "add_bot_config"
             
-            response = await send_response(
+            response = await send_config_response(
+                message, session,
                 f"👍 Bot name '{bot_name}' accepted.\n\n"
                 f"Now, please send the initial configuration for bot '{bot_name}' as JSON.\n\n"
                 "Example:\n"
@@ -652,11 +915,11 @@ async def handle_config_message(_, message: Message):
                 "Type /cancel to cancel."
             )
             if hasattr(response, 'id'):
-                session["message_id"] = response.id
+                session.message_id = response.id
             
-        elif session["current_action"] == "add_bot_config":
+        elif session.current_action == "add_bot_config":
             # Handle adding a new bot (step 2: initial config)
-            bot_name = session["data"]["bot_name"]
+            bot_name = session.data["bot_name"]
             config_text = message.text.strip()
             
             if config_text.lower() == "empty":
@@ -667,12 +930,14 @@ async def handle_config_message(_, message: Message):
                 try:
                     bot_config = json.loads(config_text)
                     if not isinstance(bot_config, dict):
-                        return await send_response(
+                        return await send_config_response(
+                            message, session,
                             "⚠️ Configuration must be a JSON object (dictionary).\n\n"
                             "Please try again or type /cancel to cancel."
                         )
                 except json.JSONDecodeError as e:
-                    return await send_response(
+                    return await send_config_response(
+                        message, session,
                         f"⚠️ Invalid JSON: {str(e)}\n\n"
                         "Please try again or type /cancel to cancel."
                     )
@@ -681,24 +946,26 @@ async def handle_config_message(_, message: Message):
             success = config_manager.update_bot_config(bot_name, bot_config)
             
             if success:
-                config_manager.save_config()
+                schedule_config_save()
                 # Return to the main menu
-                response = await send_response(
+                response = await send_config_response(
+                    message, session,
                     f"✅ Bot '{bot_name}' added successfully!",
                     reply_markup=get_main_menu()
                 )
                 if hasattr(response, 'id'):
-                    session["message_id"] = response.id
-                session["current_action"] = "main_menu"
+                    session.message_id = response.id
+                session.current_action = "main_menu"
             else:
-                await send_response(
+                await send_config_response(
+                    message, session,
                     f"❌ Failed to add bot '{bot_name}'!\n\n"
                     "Please try again or type /cancel to cancel."
                 )
     
     except Exception as e:
-        logger.error(f"Error handling message: {e}", exc_info=True)
-        await send_response(f"❌ Error: {str(e)[:200]}")
+        logger.error("Error handling message: %s", e, exc_info=True)
+        await send_config_response(message, session, f"❌ Error: {str(e)[:200]}")
 
 # Cancel command handler
 @bot.on_message(filters.command("cancel"))
@@ -715,35 +982,16 @@ async def handle_cancel_command(_, message: Message):
     
     session = active_sessions[user_id]
     
-    # Create a response function that works in both private and group chats
-    async def send_cancel_response(text, reply_markup=None):
-        if message.chat.type == ChatType.PRIVATE:
-            return await message.reply(text, reply_markup=reply_markup, parse_mode=ParseMode.MARKDOWN)
-        else:
-            # In groups, edit the original message
-            if session.get("message_id") and session.get("chat_id") == message.chat.id:
-                try:
-                    return await bot.edit_message_text(
-                        message.chat.id,
-                        session["message_id"],
-                        text,
-                        reply_markup=reply_markup,
-                        parse_mode=ParseMode.MARKDOWN
-                    )
-                except Exception as e:
-                    logger.error(f"Error editing message: {e}")
-                    return await message.reply(text, reply_markup=reply_markup, parse_mode=ParseMode.MARKDOWN)
-            else:
-                return await message.reply(text, reply_markup=reply_markup, parse_mode=ParseMode.MARKDOWN)
-    
     # Return to main menu
-    response = await send_cancel_response(
+    response = await send_config_response(
+        message,
+        session,
         "🛠️ **Bot Configuration Manager**\n\n"
         "Action cancelled. Select a bot to view or edit its configuration:",
         reply_markup=get_main_menu()
     )
     
     if hasattr(response, 'id'):
-        session["message_id"] = response.id
-    session["current_action"] = "main_menu"
-    session["data"] = {}
\ No newline at end of file
+        session.message_id = response.id
+    session.current_action = "main_menu"
+    session.data = {}
\ No newline at end of file
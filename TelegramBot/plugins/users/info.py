@@ -4,6 +4,56 @@ from pyrogram.types import Message
 from pyrogram.enums import ChatType
 
 
+# Response layout, filled with str.format_map / str.format
+_ID_TEMPLATE = (
+    "**𝙼𝚎𝚜𝚜𝚊𝚐𝚎 𝙸𝚗𝚏𝚘𝚛𝚖𝚊𝚝𝚒𝚘𝚗**\n\n"
+    "⟢ **Message ID:** `{message_id}`\n"
+    "⟢ **Date:** `{date}`\n\n"
+    "⟢ **User Information**\n\n"
+    "⟢ **User ID:** {user_id}\n"
+    "⟢ **First Name:** `{first_name}`\n"
+    "⟢ **Last Name:** `{last_name}`\n"
+    "⟢ **Username:** `{username}`\n\n"
+    "⟢ **Chat Information**\n\n"
+    "⟢ **Chat ID:** {chat_id}\n"
+    "⟢ **Chat Type:** `{chat_type}`\n"
+).format_map
+
+_FORWARD_HEADER = "\n**𝙵𝚘𝚛𝚠𝚊𝚛𝚍𝚎𝚍 𝙵𝚛𝚘𝚖:**\n\n"
+
+_FORWARD_USER_TEMPLATE = (
+    "⟢ **User ID:** {user_id}\n"
+    "⟢ **First Name:** `{first_name}`\n"
+    "⟢ **Last Name:** `{last_name}`\n"
+    "⟢ **Username:** `{username}`\n"
+).format_map
+
+_FORWARD_CHAT_TEMPLATE = (
+    "⟢ **Chat ID:** `{}`\n"
+    "⟢ **Chat Title:** `{}`\n"
+    "⟢ **Chat Type:** `{}`\n"
+).format
+
+_FILE_TEMPLATE = (
+    "\n**𝙵𝚒𝚕𝚎 𝙸𝚗𝚏𝚘𝚛𝚖𝚊𝚝𝚒𝚘𝚗**\n\n"
+    "⟢ **File ID:** `{}`\n"
+    "⟢ **File Name:** `{}`\n"
+    "⟢ **File Size:** `{}`\n"
+).format
+
+_NO_USER_FIELDS = {"user_id": "N/A", "first_name": "N/A", "last_name": "None", "username": "None"}
+
+
+def _user_fields(user) -> dict:
+    """Template fields describing a user."""
+    return {
+        "user_id": f"`{user.id}`",
+        "first_name": user.first_name,
+        "last_name": user.last_name if user.last_name else "None",
+        "username": f"@{user.username}" if user.username else "None",
+    }
+
+
 @Client.on_message(filters.command(["id"]) & is_ratelimited)
 async def get_id_info(client: Client, message: Message):
     """
@@ -18,78 +68,44 @@ async def get_id_info(client: Client, message: Message):
         target_message = message
         target_user = message.from_user
     
-    # Get chat information
-    chat_info = f"`{message.chat.id}`" if message.chat else "N/A"
-    chat_type = message.chat.type if message.chat else "N/A"
+    chat = message.chat
+    fields = {
+        # Get message information
+        "message_id": target_message.id,
+        "date": target_message.date.strftime("%Y-%m-%d %H:%M:%S") if target_message.date else "N/A",
+        # Get chat information
+        "chat_id": f"`{chat.id}`" if chat else "N/A",
+        "chat_type": chat.type if chat else "N/A",
+    }
     
     # Get user information
-    user_id = f"`{target_user.id}`" if target_user else "N/A"
-    first_name = target_user.first_name if target_user else "N/A"
-    last_name = target_user.last_name if target_user and target_user.last_name else "None"
-    username = f"@{target_user.username}" if target_user and target_user.username else "None"
-    
-    # Get message information
-    message_id = f"`{target_message.id}`"
-    date = target_message.date.strftime("%Y-%m-%d %H:%M:%S") if target_message.date else "N/A"
+    if target_user:
+        fields.update(_user_fields(target_user))
+    else:
+        fields.update(_NO_USER_FIELDS)
     
-    # Prepare the response in markdown format
-    response = (
-        f"**𝙼𝚎𝚜𝚜𝚊𝚐𝚎 𝙸𝚗𝚏𝚘𝚛𝚖𝚊𝚝𝚒𝚘𝚗**\n\n"
-        f"⟢ **Message ID:** {message_id}\n"
-        f"⟢ **Date:** `{date}`\n\n"
-        f"⟢ **User Information**\n\n"
-        f"⟢ **User ID:** {user_id}\n"
-        f"⟢ **First Name:** `{first_name}`\n"
-        f"⟢ **Last Name:** `{last_name}`\n"
-        f"⟢ **Username:** `{username}`\n\n"
-        f"⟢ **Chat Information**\n\n"
-        f"⟢ **Chat ID:** {chat_info}\n"
-        f"⟢ **Chat Type:** `{chat_type}`\n"
-    )
+    parts = [_ID_TEMPLATE(fields)]
     
     # Add forwarded information if available
-    if target_message.forward_from or target_message.forward_from_chat:
-        forward_from = target_message.forward_from
-        forward_from_chat = target_message.forward_from_chat
-        
-        response += "\n**𝙵𝚘𝚛𝚠𝚊𝚛𝚍𝚎𝚍 𝙵𝚛𝚘𝚖:**\n\n"
-        
+    forward_from = target_message.forward_from
+    forward_from_chat = target_message.forward_from_chat
+    if forward_from or forward_from_chat:
+        parts.append(_FORWARD_HEADER)
         if forward_from:
-            f_user_id = f"`{forward_from.id}`"
-            f_first_name = forward_from.first_name
-            f_last_name = forward_from.last_name if forward_from.last_name else "None"
-            f_username = f"@{forward_from.username}" if forward_from.username else "None"
-            
-            response += (
-                f"⟢ **User ID:** {f_user_id}\n"
-                f"⟢ **First Name:** `{f_first_name}`\n"
-                f"⟢ **Last Name:** `{f_last_name}`\n"
-                f"⟢ **Username:** `{f_username}`\n"
-            )
-        
+            parts.append(_FORWARD_USER_TEMPLATE(_user_fields(forward_from)))
         if forward_from_chat:
-            f_chat_id = f"`{forward_from_chat.id}`"
-            f_chat_title = forward_from_chat.title
-            f_chat_type = forward_from_chat.type
-            
-            response += (
-                f"⟢ **Chat ID:** {f_chat_id}\n"
-                f"⟢ **Chat Title:** `{f_chat_title}`\n"
-                f"⟢ **Chat Type:** `{f_chat_type}`\n"
-            )
+            parts.append(_FORWARD_CHAT_TEMPLATE(forward_from_chat.id, forward_from_chat.title, forward_from_chat.type))
     
     # Add file information if message contains media
-    if hasattr(target_message, 'document') and target_message.document:
-        file_id = f"`{target_message.document.file_id}`"
-        file_name = target_message.document.file_name if target_message.document.file_name else "N/A"
-        file_size = f"{target_message.document.file_size / 1024:.2f} KB" if target_message.document.file_size else "N/A"
-        
-        response += (
-            f"\n**𝙵𝚒𝚕𝚎 𝙸𝚗𝚏𝚘𝚛𝚖𝚊𝚝𝚒𝚘𝚗**\n\n"
-            f"⟢ **File ID:** {file_id}\n"
-            f"⟢ **File Name:** `{file_name}`\n"
-            f"⟢ **File Size:** `{file_size}`\n"
-        )
+    document = getattr(target_message, 'document', None)
+    if document:
+        parts.append(_FILE_TEMPLATE(
+            document.file_id,
+            document.file_name if document.file_name else "N/A",
+            f"{document.file_size / 1024:.2f} KB" if document.file_size else "N/A",
+        ))
+    
+    response = "".join(parts)
     
     # Send the response with a disable_web_page_preview to avoid unwanted previews
     return await message.reply_text(
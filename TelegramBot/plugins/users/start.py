@@ -52,14 +52,20 @@ COMMAND_BUTTON = [
 GOBACK_1_BUTTON = [[InlineKeyboardButton("🔙 Go Back", callback_data="START_BUTTON")]]
 GOBACK_2_BUTTON = [[InlineKeyboardButton("🔙 Go Back", callback_data="COMMAND_BUTTON")]]
 
+# The keyboards never change, so build the markups once instead of per reply
+START_MARKUP = InlineKeyboardMarkup(START_BUTTON)
+COMMAND_MARKUP = InlineKeyboardMarkup(COMMAND_BUTTON)
+GOBACK_1_MARKUP = InlineKeyboardMarkup(GOBACK_1_BUTTON)
+GOBACK_2_MARKUP = InlineKeyboardMarkup(GOBACK_2_BUTTON)
+
 @bot.on_message(filters.command(["start", "help"]) & is_ratelimited)
 async def start(_, message: Message):
     await database.save_user(message.from_user)
     return await bot.send_message(
         message.chat.id,
-        f"{START_CAPTION}",
+        START_CAPTION,
         reply_to_message_id=message.id,
-        reply_markup=InlineKeyboardMarkup(START_BUTTON),
+        reply_markup=START_MARKUP,
         parse_mode=ParseMode.HTML
     )
 
@@ -80,7 +86,7 @@ async def botCallbacks(_, CallbackQuery: CallbackQuery):
                 "You are not in the sudo user list.", show_alert=True
             )
         await CallbackQuery.edit_message_text(
-            SUDO_TEXT, reply_markup=InlineKeyboardMarkup(GOBACK_2_BUTTON)
+            SUDO_TEXT, reply_markup=GOBACK_2_MARKUP
         )
 
     elif CallbackQuery.data == "DEV_BUTTON":
@@ -89,27 +95,27 @@ async def botCallbacks(_, CallbackQuery: CallbackQuery):
                 "This is developer restricted command.", show_alert=True
             )
         await CallbackQuery.edit_message_text(
-            DEV_TEXT, reply_markup=InlineKeyboardMarkup(GOBACK_2_BUTTON)
+            DEV_TEXT, reply_markup=GOBACK_2_MARKUP
         )
 
     if CallbackQuery.data == "ABOUT_BUTTON":
         await CallbackQuery.edit_message_text(
-            ABOUT_CAPTION, reply_markup=InlineKeyboardMarkup(GOBACK_1_BUTTON)
+            ABOUT_CAPTION, reply_markup=GOBACK_1_MARKUP
         )
 
     elif CallbackQuery.data == "START_BUTTON":
         await CallbackQuery.edit_message_text(
-            START_CAPTION, reply_markup=InlineKeyboardMarkup(START_BUTTON)
+            START_CAPTION, reply_markup=START_MARKUP
         )
 
     elif CallbackQuery.data == "COMMAND_BUTTON":
         await CallbackQuery.edit_message_text(
-            COMMAND_CAPTION, reply_markup=InlineKeyboardMarkup(COMMAND_BUTTON)
+            COMMAND_CAPTION, reply_markup=COMMAND_MARKUP
         )
 
     elif CallbackQuery.data == "USER_BUTTON":
         await CallbackQuery.edit_message_text(
-            USER_TEXT, reply_markup=InlineKeyboardMarkup(GOBACK_2_BUTTON)
+            USER_TEXT, reply_markup=GOBACK_2_MARKUP
         )
     await CallbackQuery.answer()
 
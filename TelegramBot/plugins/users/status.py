@@ -1,25 +1,26 @@
-import json
+import re
 import time
 import asyncio
-from datetime import datetime
-from typing import Dict, List, Optional, Any, Tuple, Union
-from functools import wraps
+from typing import Dict, List, Mapping, Optional, Any, Tuple
+from functools import lru_cache, wraps
 
 from pyrogram import filters
 from pyrogram.enums import ParseMode
+from pyrogram.errors import MessageNotModified
 from pyrogram.types import (
     CallbackQuery,
     InlineKeyboardButton,
     InlineKeyboardMarkup,
-    Message,
 )
 
 from TelegramBot import bot
 from TelegramBot.database import database
-from TelegramBot.helpers.filters import is_ratelimited
 from TelegramBot.config import OWNER_USERID, SUDO_USERID, LOG_CHANNEL
 from TelegramBot.config import get_config_manager
-from TelegramBot.helpers.async_pinger import AsyncPinger
+from TelegramBot.helpers.async_pinger import get_shared_pinger
+from TelegramBot.logging import LOGGER
+
+logger = LOGGER(__name__)
 
 # Constants for callback data prefixes
 PREFIX_PING = "PING_"
@@ -29,7 +30,6 @@ PREFIX_REPORT = "RPT_"
 PREFIX_REPORT_TYPE = "RTYPE_"
 PREFIX_CLOSE = "CLOSE_"
 PREFIX_BACK = "BACK_"
-PREFIX_ADMIN = "ADM_"
 STATUS_PREFIX = "STATUS_"
 
 # Error report types
@@ -41,37 +41,86 @@ ERROR_TYPES = {
     "5": "Other issue",
 }
 
-# Cache for last deploy times and bot status
+# Menu texts shared by the status, refresh and back handlers
+_ADMIN_MENU_HEADER = "🖥️ 𝖠𝖣𝖬𝖨𝖭 𝖲𝗂𝗍𝖾 𝖲𝗍𝖺𝗍𝗎𝗌\n\nSelect a bot to check detailed status:"
+_ADMIN_MENU_HEADER_REFRESHED = "🖥️ 𝖠𝖣𝖬𝖨𝖭 𝖲𝗂𝗍𝖾 𝖲𝗍𝖺𝗍𝗎𝗌 (🔄 Refreshed)\n\nSelect a bot to check detailed status:"
+_USER_MENU_HEADER = "🤖 𝖡𝗈𝗍 𝖲𝗍𝖺𝗍𝗎𝗌\n\nSelect a bot to check status:"
+
+# Cache for last deploy times and bot status. The database keeps a copy so
+# the last known status and deploy time survive restarts
 cache = {
     "last_deploy": {},
     "bot_status": {},
-    "last_check": {}
+    "last_check": {},
+    "expires": {},  # time.monotonic() deadline until which a bot's status is fresh
+    "failures": {},  # Consecutive failed pings of bots last seen online
+    "stale": {}  # True while a bot's failed pings are covered by its last good status
 }
 
-# Initialize AsyncPinger with default settings
-default_pinger = AsyncPinger(max_retries=3, retry_delay=1.0, timeout=10.0, concurrent_limit=1)
+# Seconds a cached status stays fresh; failures expire sooner so an outage
+# is noticed to be over quickly
+STATUS_TTL_ONLINE = 30
+STATUS_TTL_OFFLINE = 5
+# Failed pings in a row before a bot that was online is reported offline
+OFFLINE_AFTER_FAILURES = 3
+
+# Strong refs to background tasks (database writes, delayed status
+# refreshes) so they aren't GC'd mid-run
+_background_tasks = set()
+
+# Hash of the last text and markup sent to each message, keyed by
+# (chat id, message id), so identical edits can be skipped
+_last_edit_sig: Dict[Tuple[int, int], int] = {}
+EDIT_SIG_CACHE_SIZE = 1024
+
+# Status refreshes in progress, keyed by bot name; concurrent requests for
+# the same bot wait for the running one instead of pinging again
+_inflight: Dict[str, asyncio.Future] = {}
+
+# The "Refresh All" batch in progress; concurrent refreshes wait for it
+_refresh_all_task: Optional[asyncio.Future] = None
+
+# (second, formatted) of the last format_timestamp call
+_last_timestamp = (-1, "")
+
+# OWNER_USERID and SUDO_USERID are frozensets; merge them once so the
+# admin check is a single hash lookup
+_ADMIN_IDS = OWNER_USERID | SUDO_USERID
+
+# Get config manager instance
+config_manager = get_config_manager()
 
 
 def is_admin(user_id: int) -> bool:
     """Check if user is an admin (owner or sudo user)."""
-    return user_id in [OWNER_USERID] + SUDO_USERID
+    return user_id in _ADMIN_IDS
 
 
 def format_timestamp(timestamp: Optional[float] = None) -> str:
     """Format timestamp in a consistent way."""
+    global _last_timestamp
     if timestamp is None:
         timestamp = time.time()
-    return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
+    # The format has one-second resolution, so calls within the same second
+    # share one formatted string
+    second = int(timestamp)
+    if _last_timestamp[0] != second:
+        _last_timestamp = (second, time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second)))
+    return _last_timestamp[1]
 
 
-def get_bot_config() -> Dict:
-    """Get bot configuration dictionary from config manager."""
+def get_bot_config() -> Mapping[str, Mapping[str, Any]]:
+    """
+    Get the bot configurations from the config manager.
+    
+    This is the manager's shared read-only view, rebuilt only when the
+    configuration changes, so it is cheap to call from every callback.
+    """
     try:
-        config_manager = get_config_manager()
         return config_manager.get_all_bots()
     except Exception as e:
         # Fallback to empty config on error
-        print(f"Error loading bot config: {e}")
+        logger.warning("Error loading bot config: %s", e, exc_info=True)
         return {}
 
 
@@ -91,35 +140,59 @@ def verify_callback_initiator(func):
     return wrapper
 
 
+async def safe_edit(
+    callback_query: CallbackQuery,
+    text: str,
+    reply_markup: Optional[InlineKeyboardMarkup] = None,
+    parse_mode: Optional[ParseMode] = None,
+) -> None:
+    """Edit the callback's message unless it already shows this text and markup."""
+    message = callback_query.message
+    key = (message.chat.id, message.id)
+    sig = hash((text, repr(reply_markup)))
+    if _last_edit_sig.get(key) == sig:
+        return
+    
+    try:
+        await callback_query.edit_message_text(text, reply_markup=reply_markup, parse_mode=parse_mode)
+    except MessageNotModified:
+        pass
+    
+    # Re-insert so the dict stays in order of last edit and the oldest is dropped first
+    _last_edit_sig.pop(key, None)
+    _last_edit_sig[key] = sig
+    if len(_last_edit_sig) > EDIT_SIG_CACHE_SIZE:
+        del _last_edit_sig[next(iter(_last_edit_sig))]
+
+
+def _display_name(bot_name: str, bot_info: Mapping[str, Any], for_admin: bool) -> str:
+    """Button label of a bot in the status menu."""
+    display_name = bot_name
+    
+    # For admins, add a marker to disabled bots
+    if for_admin and bot_info.get("disabled", False):
+        display_name = f"[!] {bot_name}"
+    
+    # Add status indicator if available
+    status = cache["bot_status"].get(bot_name)
+    if status is not None:
+        status_emoji = "🟢" if status else "🔴"
+        display_name = f"{status_emoji} {display_name}"
+    
+    return display_name
+
+
 def create_bot_keyboard(for_admin: bool = False) -> InlineKeyboardMarkup:
     """Create inline keyboard with bot buttons."""
-    bots_config = get_bot_config()
-    buttons = []
-    
-    # Create a button for each bot
-    for bot_name in bots_config:
-        # Skip disabled bots for non-admins
-        if bots_config[bot_name].get("disabled", False) and not for_admin:
-            continue
-            
-        # Create a button with bot name and callback data
-        display_name = bot_name
-        
-        # For admins, add a marker to disabled bots
-        if for_admin and bots_config[bot_name].get("disabled", False):
-            display_name = f"[!] {bot_name}"
-            
-        # Add status indicator if available
-        if bot_name in cache["bot_status"]:
-            status_emoji = "🟢" if cache["bot_status"][bot_name] else "🔴"
-            display_name = f"{status_emoji} {display_name}"
-            
-        buttons.append(
-            InlineKeyboardButton(
-                display_name, 
-                callback_data=f"{PREFIX_PING}{bot_name}"
-            )
+    # One button per bot; disabled bots are hidden from non-admins
+    buttons = [
+        InlineKeyboardButton(
+            _display_name(bot_name, bot_info, for_admin),
+            callback_data=f"{PREFIX_PING}{bot_name}"
         )
+        for bot_name, bot_info in get_bot_config().items()
+        if for_admin or not bot_info.get("disabled", False)
+    ]
     
     # Arrange buttons in pairs (2 per row)
     keyboard = [buttons[i:i+2] for i in range(0, len(buttons), 2)]
@@ -150,22 +223,17 @@ async def ping_bot(bot_info: Dict) -> Tuple[bool, Optional[float], Optional[str]
     max_retries = bot_info.get('retries', 3)
     timeout = bot_info.get('timeout', 10.0)
     
-    pinger = AsyncPinger(
-        max_retries=max_retries,
-        retry_delay=1.0,
-        timeout=timeout,
-        concurrent_limit=1
-    )
+    # Shared pinger: its session and connections outlive this call
+    pinger = get_shared_pinger(max_retries=max_retries, timeout=timeout)
     
     try:
         results = await pinger.ping_multiple([url])
         result = results[0] if results else None
-        await pinger.close() # close the session
         
         if result and result.is_success():
             return True, result.response_time, str(result.status_code)
         elif result:
-            return False, result.response_time, str(result.status.value)
+            return False, result.response_time, result.status.name.lower()
         else:
             return False, None, "Connection failed"
             
@@ -173,46 +241,230 @@ async def ping_bot(bot_info: Dict) -> Tuple[bool, Optional[float], Optional[str]
         return False, None, str(e)
 
 
+def run_in_background(coro) -> asyncio.Task:
+    """Run a coroutine as a task that nothing awaits."""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
+def store_bot_status(bot_name: str, **fields) -> None:
+    """Save status fields of a bot to the database in the background."""
+    async def _store():
+        try:
+            await database.save_bot_status(bot_name, fields)
+        except Exception as e:
+            logger.warning("Failed to save bot status: %s", e, exc_info=True)
+    
+    run_in_background(_store())
+
+
+async def load_bot_status(bot_name: str) -> bool:
+    """
+    Fill the cache with the status of a bot saved in the database.
+    
+    Returns:
+        True if a saved status was found
+    """
+    try:
+        stored = await database.get_bot_status(bot_name)
+    except Exception as e:
+        logger.warning("Failed to load bot status: %s", e, exc_info=True)
+        return False
+    if not stored:
+        return False
+    
+    if "last_deploy" in stored:
+        cache["last_deploy"].setdefault(bot_name, stored["last_deploy"])
+    if "is_online" not in stored or "checked_at" not in stored:
+        return False
+    cache["bot_status"][bot_name] = stored["is_online"]
+    cache["last_check"][bot_name] = stored["checked_at"]
+    # Still fresh if it was checked recently enough before a restart
+    ttl = STATUS_TTL_ONLINE if stored["is_online"] else STATUS_TTL_OFFLINE
+    age = time.time() - stored.get("checked_ts", 0.0)
+    cache["expires"][bot_name] = time.monotonic() + ttl - age
+    return True
+
+
+def cache_bot_status(bot_name: str, is_online: bool, checked_at: str) -> None:
+    """
+    Record a ping result in the cache and save it to the database.
+    
+    A failed ping of a bot that was online keeps the last good status,
+    marked stale, until OFFLINE_AFTER_FAILURES pings in a row have failed.
+    """
+    if is_online:
+        cache["failures"].pop(bot_name, None)
+    elif cache["bot_status"].get(bot_name):
+        failures = cache["failures"][bot_name] = cache["failures"].get(bot_name, 0) + 1
+        if failures < OFFLINE_AFTER_FAILURES:
+            cache["stale"][bot_name] = True
+            # Check again soon rather than serving the old status for long
+            cache["expires"][bot_name] = time.monotonic() + STATUS_TTL_OFFLINE
+            return
+        cache["failures"].pop(bot_name, None)
+    
+    cache["stale"].pop(bot_name, None)
+    cache["bot_status"][bot_name] = is_online
+    cache["last_check"][bot_name] = checked_at
+    ttl = STATUS_TTL_ONLINE if is_online else STATUS_TTL_OFFLINE
+    cache["expires"][bot_name] = time.monotonic() + ttl
+    store_bot_status(bot_name, is_online=is_online, checked_at=checked_at, checked_ts=time.time())
+
+
 async def update_bot_status(bot_name: str, bot_info: Dict) -> Dict:
     """
     Update bot status in cache and return status information.
+    
+    Callers that arrive while the bot is already being pinged share the
+    result of that ping.
     """
+    task = _inflight.get(bot_name)
+    if task is None:
+        task = asyncio.ensure_future(_refresh_bot_status(bot_name, bot_info))
+        _inflight[bot_name] = task
+        task.add_done_callback(lambda _: _inflight.pop(bot_name, None))
+    # Shielded so one caller giving up does not cancel the ping for the others
+    return await asyncio.shield(task)
+
+
+async def _refresh_bot_status(bot_name: str, bot_info: Dict) -> Dict:
+    """Ping a bot and store the result in the cache."""
     is_online, response_time, status_code = await ping_bot(bot_info)
     
     # Update cache
-    cache["bot_status"][bot_name] = is_online
-    cache["last_check"][bot_name] = format_timestamp()
+    cache_bot_status(bot_name, is_online, format_timestamp())
     
     return {
-        "is_online": is_online,
+        "is_online": cache["bot_status"][bot_name],
         "response_time": response_time,
         "status_code": status_code,
-        "checked_at": cache["last_check"][bot_name]
+        "checked_at": cache["last_check"][bot_name],
+        "stale": cache["stale"].get(bot_name, False)
     }
 
 
-async def get_user_bot_info(bot_name: str, bot_info: Dict) -> str:
-    """Create a simplified bot info message for regular users."""
-    # Get or update status
-    if bot_name not in cache["bot_status"] or bot_name not in cache["last_check"]:
-        status = await update_bot_status(bot_name, bot_info)
-    else:
-        status = {
-            "is_online": cache["bot_status"].get(bot_name, False),
-            "response_time": None,
-            "checked_at": cache["last_check"].get(bot_name, "N/A")
-        }
+async def _delayed_refresh(bot_name: str, bot_info: Dict, delay: float) -> None:
+    """Refresh a bot's status after `delay` seconds."""
+    await asyncio.sleep(delay)
+    await update_bot_status(bot_name, bot_info)
+
+
+async def refresh_all_bot_statuses(bots_config: Mapping[str, Mapping[str, Any]]) -> None:
+    """
+    Ping every configured bot and update the cache.
+    
+    Callers that arrive while a refresh is already running share it.
+    """
+    global _refresh_all_task
+    if _refresh_all_task is None:
+        _refresh_all_task = asyncio.ensure_future(_refresh_all(bots_config))
+        
+        def _clear(_):
+            global _refresh_all_task
+            _refresh_all_task = None
+        _refresh_all_task.add_done_callback(_clear)
+    # Shielded so one caller giving up does not cancel the batch for the others
+    await asyncio.shield(_refresh_all_task)
+
+
+async def _refresh_all(bots_config: Mapping[str, Mapping[str, Any]]) -> None:
+    """
+    Ping every bot that isn't already being refreshed.
+    
+    Bots are grouped by their retry and timeout settings, and each group
+    is pinged with one ping_multiple call on its shared pinger. Bots with a
+    refresh in flight are awaited instead of pinged again.
+    """
+    checked_at = format_timestamp()
+    groups: Dict[Tuple[int, float], List[Tuple[str, str]]] = {}
+    running = []
+    for bot_name, bot_info in bots_config.items():
+        task = _inflight.get(bot_name)
+        if task is not None:
+            running.append(asyncio.shield(task))
+            continue
+        url = bot_info.get('url')
+        if not url:
+            # Same as ping_bot: a bot without a URL counts as offline
+            cache_bot_status(bot_name, False, checked_at)
+            continue
+        key = (bot_info.get('retries', 3), bot_info.get('timeout', 10.0))
+        groups.setdefault(key, []).append((bot_name, url))
+    
+    async def _ping_group(key, members):
+        try:
+            pinger = get_shared_pinger(max_retries=key[0], timeout=key[1])
+            results = await pinger.ping_multiple([url for _, url in members])
+        except Exception as e:
+            # Count the group as failed pings so cache_bot_status falls back
+            # to the cached status or offline, and the callback still completes
+            logger.warning("Failed to refresh %d bots: %s", len(members), e, exc_info=True)
+            results = [None] * len(members)
+        for (bot_name, _), result in zip(members, results):
+            cache_bot_status(bot_name, result is not None and result.is_success(), checked_at)
+    
+    # Failures of refreshes started elsewhere are reported to their own callers
+    await asyncio.gather(
+        *(_ping_group(key, members) for key, members in groups.items()),
+        *running,
+        return_exceptions=True
+    )
+
+
+async def get_bot_status(bot_name: str, bot_info: Dict) -> Dict:
+    """
+    Get the status of a bot from the cache, then the database, and only
+    ping the bot if neither has a fresh one.
+    """
+    if bot_name not in cache["bot_status"]:
+        await load_bot_status(bot_name)
+    if cache["expires"].get(bot_name, 0.0) <= time.monotonic():
+        return await update_bot_status(bot_name, bot_info)
+    
+    return {
+        "is_online": cache["bot_status"].get(bot_name, False),
+        "response_time": None,
+        "status_code": None,
+        "checked_at": cache["last_check"].get(bot_name, "N/A"),
+        "stale": cache["stale"].get(bot_name, False)
+    }
+
+
+async def _prepare_status(bot_name: str, bot_info: Dict) -> Dict:
+    """
+    Look up a bot's status and format the fields shared by the user and
+    admin views.
+    
+    Returns:
+        Dict: The get_bot_status fields plus status_text, response_time_str
+        and last_deploy
+    """
+    status = await get_bot_status(bot_name, bot_info)
     
-    # Format status information
     status_text = "🟢 Online" if status["is_online"] else "🔴 Offline"
-    response_time = f"{status['response_time']:.2f}s" if status.get('response_time') else "N/A"
-    last_deploy = cache["last_deploy"].get(bot_name, "♧ Unknown")
+    if status["stale"]:
+        status_text += " (cached)"
+    # Concurrent callers share the refresh result, so extend a copy
+    return {
+        **status,
+        "status_text": status_text,
+        "response_time_str": f"{status['response_time']:.2f}s" if status.get("response_time") else "N/A",
+        "last_deploy": cache["last_deploy"].get(bot_name, "♧ Unknown"),
+    }
+
+
+async def get_user_bot_info(bot_name: str, bot_info: Dict) -> str:
+    """Create a simplified bot info message for regular users."""
+    status = await _prepare_status(bot_name, bot_info)
     
     message = (
         f"𝖡𝗈𝗍 𝖲𝗍𝖺𝗍𝗎𝗌:    {bot_name}\n\n"
-        f"𝖲𝗍𝖺𝗍𝗎𝗌:    {status_text}\n"
-        f"𝖫𝖺𝗌𝗍 𝖣𝖾𝗉𝗅𝗈𝗒:    {last_deploy}\n"
-        f"𝖯𝗂𝗇𝗀 𝗍𝗂𝗆𝖾:    {response_time}\n"
+        f"𝖲𝗍𝖺𝗍𝗎𝗌:    {status['status_text']}\n"
+        f"𝖫𝖺𝗌𝗍 𝖣𝖾𝗉𝗅𝗈𝗒:    {status['last_deploy']}\n"
+        f"𝖯𝗂𝗇𝗀 𝗍𝗂𝗆𝖾:    {status['response_time_str']}\n"
         f"𝖫𝖺𝗌𝗍 𝖢𝗁𝖾𝖼𝗄𝖾𝖽:    {status['checked_at']}\n"
     )
     
@@ -221,62 +473,46 @@ async def get_user_bot_info(bot_name: str, bot_info: Dict) -> str:
 
 async def get_admin_bot_info(bot_name: str, bot_info: Dict) -> str:
     """Create a detailed bot info message for admins."""
-    # Get or update status
-    if bot_name not in cache["bot_status"] or bot_name not in cache["last_check"]:
-        status = await update_bot_status(bot_name, bot_info)
-    else:
-        status = {
-            "is_online": cache["bot_status"].get(bot_name, False),
-            "response_time": None, 
-            "status_code": None,
-            "checked_at": cache["last_check"].get(bot_name, "N/A")
-        }
-    
-    # Format status information
-    status_text = "🟢 Online" if status["is_online"] else "🔴 Offline"
-    response_time = f"{status['response_time']:.2f}s" if status.get('response_time') else "N/A"
-    last_deploy = cache["last_deploy"].get(bot_name, "♧ Unknown")
+    status = await _prepare_status(bot_name, bot_info)
     
-    message = (
+    parts = [
         f"Bot Info (𝙰𝚍𝚖𝚒𝚗): {bot_name}\n\n"
-        f"𝖲𝗍𝖺𝗍𝗎𝗌:    {status_text}\n"
+        f"𝖲𝗍𝖺𝗍𝗎𝗌:    {status['status_text']}\n"
         f"𝖲𝗍𝖺𝗍𝗎𝗌 𝖢𝗈𝖽𝖾:    {status.get('status_code', 'N/A')}\n"
-        f"𝖫𝖺𝗌𝗍 𝖣𝖾𝗉𝗅𝗈𝗒:    {last_deploy}\n"
+        f"𝖫𝖺𝗌𝗍 𝖣𝖾𝗉𝗅𝗈𝗒:    {status['last_deploy']}\n"
         f"𝖱𝖾𝗍𝗋𝗂𝖾𝗌:    {bot_info.get('retries', 3)}\n"
         f"𝖯𝗂𝗇𝗀 𝖨𝗇𝗍𝖾𝗋𝗏𝖺𝗅:    {bot_info.get('ping_interval', 60)} s\n"
         f"𝖳𝗂𝗆𝖾𝗈𝗎𝗍:    {bot_info.get('timeout', 10)} s\n"
-        f"𝖯𝗂𝗇𝗀 𝗍𝗂𝗆𝖾:    {response_time}\n"
+        f"𝖯𝗂𝗇𝗀 𝗍𝗂𝗆𝖾:    {status['response_time_str']}\n"
         f"𝖫𝖺𝗌𝗍 𝖢𝗁𝖾𝖼𝗄𝖾𝖽:    {status['checked_at']}\n"
-    )
+    ]
     
     # Add optional information if available
     if bot_info.get('auto_redeploy'):
-        message += f"𝖠𝗎𝗍𝗈 𝖽𝖾𝗉𝗅𝗈𝗒:    𝗘𝗻𝗮𝗯𝗹𝗲𝗱\n"
+        parts.append("𝖠𝗎𝗍𝗈 𝖽𝖾𝗉𝗅𝗈𝗒:    𝗘𝗻𝗮𝗯𝗹𝗲𝗱\n")
         if bot_info.get('redeploy_url'):
-            message += f"𝖱𝖾𝖽𝖾𝗉𝗅𝗈𝗒 𝖴𝖱𝖫:    {bot_info['redeploy_url']}\n"
-        message += f"𝖱𝖾𝖽𝖾𝗉𝗅𝗈𝗒 𝖢𝗈𝗈𝗅𝖽𝗈𝗐𝗇:    {bot_info.get('redeploy_cooldown', 0)} s\n"
+            parts.append(f"𝖱𝖾𝖽𝖾𝗉𝗅𝗈𝗒 𝖴𝖱𝖫:    {bot_info['redeploy_url']}\n")
+        parts.append(f"𝖱𝖾𝖽𝖾𝗉𝗅𝗈𝗒 𝖢𝗈𝗈𝗅𝖽𝗈𝗐𝗇:    {bot_info.get('redeploy_cooldown', 0)} s\n")
     else:
-        message += "𝖠𝗎𝗍𝗈 𝖱𝖾𝖽𝖾𝗉𝗅𝗈𝗒:    𝗗𝗶𝘀𝗮𝗯𝗹𝗲𝗱\n"
+        parts.append("𝖠𝗎𝗍𝗈 𝖱𝖾𝖽𝖾𝗉𝗅𝗈𝗒:    𝗗𝗶𝘀𝗮𝗯𝗹𝗲𝗱\n")
     
     if bot_info.get('can_people_redeploy'):
-        message += "𝖬𝖺𝗇𝗎𝖺𝗅 𝖱𝖾𝖽𝖾𝗉𝗅𝗈𝗒:    𝗔𝗹𝗹𝗼𝘄𝗲𝗱\n"
+        parts.append("𝖬𝖺𝗇𝗎𝖺𝗅 𝖱𝖾𝖽𝖾𝗉𝗅𝗈𝗒:    𝗔𝗹𝗹𝗼𝘄𝗲𝗱\n")
     else:
-        message += "𝖬𝖺𝗇𝗎𝖺𝗅 𝖱𝖾𝖽𝖾𝗉𝗅𝗈𝗒:    𝗡𝗼𝘁 𝗮𝗹𝗹𝗼𝘄𝗲𝗱\n"
+        parts.append("𝖬𝖺𝗇𝗎𝖺𝗅 𝖱𝖾𝖽𝖾𝗉𝗅𝗈𝗒:    𝗡𝗼𝘁 𝗮𝗹𝗹𝗼𝘄𝗲𝗱\n")
         
     if bot_info.get('url_bot'):
-        message += f"𝖡𝗈𝗍 𝖴𝖱𝖫:    {bot_info['url_bot']}\n"
+        parts.append(f"𝖡𝗈𝗍 𝖴𝖱𝖫:    {bot_info['url_bot']}\n")
         
     if bot_info.get('disabled'):
-        message += "\n[!] 𝗡𝗢𝗧𝗘: This bot is currently disabled."
+        parts.append("\n[!] 𝗡𝗢𝗧𝗘: This bot is currently disabled.")
     
-    return message
+    return "".join(parts)
 
 
-@bot.on_callback_query(filters.regex(f"^{STATUS_PREFIX}"))
-@verify_callback_initiator
 async def handle_status_commands(_, callback_query: CallbackQuery):
     """Handler for status menu and refresh actions."""
-    command = callback_query.data.replace(STATUS_PREFIX, "")
+    command = callback_query.data[len(STATUS_PREFIX):]
     user_id = callback_query.from_user.id
     is_user_admin = is_admin(user_id)
     
@@ -284,17 +520,17 @@ async def handle_status_commands(_, callback_query: CallbackQuery):
         # Different menu for admins
         if is_user_admin:
             keyboard = create_bot_keyboard(for_admin=True)
-            await callback_query.message.edit_text(
-                "🖥️ 𝖠𝖣𝖬𝖨𝖭 𝖲𝗂𝗍𝖾 𝖲𝗍𝖺𝗍𝗎𝗌\n\n"
-                "Select a bot to check detailed status:",
+            await safe_edit(
+                callback_query,
+                _ADMIN_MENU_HEADER,
                 reply_markup=keyboard,
                 parse_mode=ParseMode.MARKDOWN
             )
         else:
             keyboard = create_bot_keyboard(for_admin=False)
-            await callback_query.message.edit_text(
-                "🤖 𝖡𝗈𝗍 𝖲𝗍𝖺𝗍𝗎𝗌\n\n"
-                "Select a bot to check status:",
+            await safe_edit(
+                callback_query,
+                _USER_MENU_HEADER,
                 reply_markup=keyboard,
                 parse_mode=ParseMode.MARKDOWN
             )
@@ -305,29 +541,19 @@ async def handle_status_commands(_, callback_query: CallbackQuery):
         await callback_query.answer("Refreshing all bot statuses...", show_alert=False)
         
         # Get all bot configs and update their status
-        bots_config = get_bot_config()
-        refresh_tasks = []
-        
-        for bot_name, bot_info in bots_config.items():
-            refresh_tasks.append(update_bot_status(bot_name, bot_info))
-        
-        # Wait for all refresh tasks to complete
-        if refresh_tasks:
-            await asyncio.gather(*refresh_tasks)
+        await refresh_all_bot_statuses(get_bot_config())
         
         # Recreate keyboard with updated statuses
         keyboard = create_bot_keyboard(for_admin=True)
         
-        await callback_query.message.edit_text(
-            "🖥️ 𝖠𝖣𝖬𝖨𝖭 𝖲𝗂𝗍𝖾 𝖲𝗍𝖺𝗍𝗎𝗌 (🔄 Refreshed)\n\n"
-            "Select a bot to check detailed status:",
+        await safe_edit(
+            callback_query,
+            _ADMIN_MENU_HEADER_REFRESHED,
             reply_markup=keyboard,
             parse_mode=ParseMode.MARKDOWN
         )
 
 
-@bot.on_callback_query(filters.regex(f"^{PREFIX_PING}|^{PREFIX_CLOSE}"))
-@verify_callback_initiator
 async def handle_bot_callback(_, callback_query: CallbackQuery):
     """Callback handler for bot ping requests."""
     # Handle close action
@@ -336,7 +562,7 @@ async def handle_bot_callback(_, callback_query: CallbackQuery):
         return await callback_query.answer("Menu closed")
     
     # Extract bot name from callback data
-    bot_name = callback_query.data.replace(PREFIX_PING, "")
+    bot_name = callback_query.data[len(PREFIX_PING):]
     user_id = callback_query.from_user.id
     is_user_admin = is_admin(user_id)
     
@@ -389,7 +615,8 @@ async def handle_bot_callback(_, callback_query: CallbackQuery):
     keyboard.append(back_row)
     
     # Update the message with bot info and buttons
-    await callback_query.edit_message_text(
+    await safe_edit(
+        callback_query,
         message,
         reply_markup=InlineKeyboardMarkup(keyboard),
         parse_mode=ParseMode.MARKDOWN
@@ -397,26 +624,24 @@ async def handle_bot_callback(_, callback_query: CallbackQuery):
     await callback_query.answer()
 
 
-@bot.on_callback_query(filters.regex(f"^{PREFIX_BACK}"))
-@verify_callback_initiator
 async def show_bots_menu(_, callback_query: CallbackQuery):
     """Callback handler to return to the bots menu."""
-    back_to = callback_query.data.replace(PREFIX_BACK, "")
+    back_to = callback_query.data[len(PREFIX_BACK):]
     is_admin_menu = back_to.startswith("ADMIN_")
     
     keyboard = create_bot_keyboard(for_admin=is_admin_menu)
     
     if is_admin_menu:
-        await callback_query.edit_message_text(
-            "🖥️ 𝖠𝖣𝖬𝖨𝖭 𝖲𝗂𝗍𝖾 𝖲𝗍𝖺𝗍𝗎𝗌\n\n"
-            "Select a bot to check detailed status:",
+        await safe_edit(
+            callback_query,
+            _ADMIN_MENU_HEADER,
             reply_markup=keyboard,
             parse_mode=ParseMode.MARKDOWN
         )
     else:
-        await callback_query.edit_message_text(
-            "🤖 𝖡𝗈𝗍 𝖲𝗍𝖺𝗍𝗎𝗌\n\n"
-            "Select a bot to check status:",
+        await safe_edit(
+            callback_query,
+            _USER_MENU_HEADER,
             reply_markup=keyboard,
             parse_mode=ParseMode.MARKDOWN
         )
@@ -424,8 +649,6 @@ async def show_bots_menu(_, callback_query: CallbackQuery):
     await callback_query.answer()
 
 
-@bot.on_callback_query(filters.regex(f"^{PREFIX_CHECK}|^{PREFIX_REDEPLOY}"))
-@verify_callback_initiator
 async def handle_bot_actions(_, callback_query: CallbackQuery):
     """Callback handler for bot check and redeploy actions."""
     user_id = callback_query.from_user.id
@@ -436,10 +659,10 @@ async def handle_bot_actions(_, callback_query: CallbackQuery):
     is_redeploy = callback_query.data.startswith(PREFIX_REDEPLOY)
     
     if is_check:
-        bot_name = callback_query.data.replace(PREFIX_CHECK, "")
+        bot_name = callback_query.data[len(PREFIX_CHECK):]
         action = "CHECK"
     elif is_redeploy:
-        bot_name = callback_query.data.replace(PREFIX_REDEPLOY, "")
+        bot_name = callback_query.data[len(PREFIX_REDEPLOY):]
         action = "REDEPLOY"
     else:
         return await callback_query.answer("Invalid action", show_alert=True)
@@ -471,7 +694,8 @@ async def handle_bot_actions(_, callback_query: CallbackQuery):
         
         if is_check:
             # Ping the bot
-            await callback_query.edit_message_text(
+            await safe_edit(
+                callback_query,
                 current_text + "\n\n[⏳] Checking bot status...",
                 reply_markup=callback_query.message.reply_markup,
                 parse_mode=ParseMode.MARKDOWN
@@ -482,6 +706,8 @@ async def handle_bot_actions(_, callback_query: CallbackQuery):
             
             if status:
                 status_text = "✅ ONLINE" if status["is_online"] else "❌ OFFLINE"
+                if status["stale"]:
+                    status_text += " (cached)"
                 response_time = f"{status['response_time']:.2f}s" if status.get("response_time") else "N/A"
                 
                 # Different status reports for admin vs user
@@ -501,13 +727,15 @@ async def handle_bot_actions(_, callback_query: CallbackQuery):
                         f"Checked at: {status['checked_at']}"
                     )
                 
-                await callback_query.edit_message_text(
+                await safe_edit(
+                    callback_query,
                     current_text + status_message,
                     reply_markup=callback_query.message.reply_markup,
                     parse_mode=ParseMode.MARKDOWN
                 )
             else:
-                await callback_query.edit_message_text(
+                await safe_edit(
+                    callback_query,
                     current_text + "\n\n[❌] Failed to check bot status.",
                     reply_markup=callback_query.message.reply_markup,
                     parse_mode=ParseMode.MARKDOWN
@@ -516,40 +744,38 @@ async def handle_bot_actions(_, callback_query: CallbackQuery):
         elif is_redeploy:
             # Check if redeploy URL is configured
             if not bot_info.get('redeploy_url'):
-                return await callback_query.edit_message_text(
+                return await safe_edit(
+                    callback_query,
                     current_text + "\n\n[❌] No redeploy URL configured for this bot.",
                     reply_markup=callback_query.message.reply_markup,
                     parse_mode=ParseMode.MARKDOWN
                 )
                 
             # Trigger redeploy
-            await callback_query.edit_message_text(
+            await safe_edit(
+                callback_query,
                 current_text + "\n\n[⏳] Triggering redeploy...",
                 reply_markup=callback_query.message.reply_markup,
                 parse_mode=ParseMode.MARKDOWN
             )
             
             redeploy_url = bot_info.get('redeploy_url', '')
-            pinger = AsyncPinger(
-                max_retries=1,
-                retry_delay=1.0,
-                timeout=bot_info.get('timeout', 30.0),
-                concurrent_limit=1
-            )
+            pinger = get_shared_pinger(max_retries=1, timeout=bot_info.get('timeout', 30.0))
             
-            results = await pinger.ping_multiple([redeploy_url])
+            results = await pinger.ping_multiple([redeploy_url], head=False)
             result = results[0] if results else None
-            await pinger.close() # close the session
             
             if result and result.is_success():
                 # Update last deploy time in cache
                 cache["last_deploy"][bot_name] = format_timestamp()
+                store_bot_status(bot_name, last_deploy=cache["last_deploy"][bot_name])
                 
-                # Update bot status after redeploy
-                await asyncio.sleep(2)  # Give some time for redeploy to kick in
-                await update_bot_status(bot_name, bot_info)
+                # Update bot status after redeploy, giving it some time to
+                # kick in; the user doesn't wait for this
+                run_in_background(_delayed_refresh(bot_name, bot_info, 2.0))
                 
-                await callback_query.edit_message_text(
+                await safe_edit(
+                    callback_query,
                     current_text + "\n\n[✅] Redeploy triggered successfully.",
                     reply_markup=callback_query.message.reply_markup,
                     parse_mode=ParseMode.MARKDOWN
@@ -566,11 +792,12 @@ async def handle_bot_actions(_, callback_query: CallbackQuery):
                         )
                         await bot.send_message(LOG_CHANNEL, log_message)
                     except Exception as e:
-                        print(f"Failed to send redeploy log: {e}")
+                        logger.warning("Failed to send redeploy log: %s", e, exc_info=True)
                 
             else:
-                error_code = result.status.value if result else "Connection failed"
-                await callback_query.edit_message_text(
+                error_code = result.status.name.lower() if result else "Connection failed"
+                await safe_edit(
+                    callback_query,
                     current_text + f"\n\n[❌] Failed to trigger redeploy. Error: {error_code}",
                     reply_markup=callback_query.message.reply_markup,
                     parse_mode=ParseMode.MARKDOWN
@@ -579,28 +806,27 @@ async def handle_bot_actions(_, callback_query: CallbackQuery):
     except Exception as e:
         # Handle errors
         error_msg = str(e)[:100] if is_user_admin else "An error occurred"
-        await callback_query.edit_message_text(
+        await safe_edit(
+            callback_query,
             current_text + f"\n\n[❌] Error: {error_msg}",
             reply_markup=callback_query.message.reply_markup,
             parse_mode=ParseMode.MARKDOWN
         )
 
 
-@bot.on_callback_query(filters.regex(f"^{PREFIX_REPORT}"))
-@verify_callback_initiator
-async def handle_report_error(_, callback_query: CallbackQuery):
-    """Callback handler for error reporting."""
-    bot_name = callback_query.data.replace(PREFIX_REPORT, "")
-    
+@lru_cache(maxsize=128)
+def build_report_keyboard(bot_name: str) -> InlineKeyboardMarkup:
+    """Build the error type selection keyboard for a bot."""
     # Create error type selection buttons
-    buttons = []
-    for key, error_type in ERROR_TYPES.items():
-        buttons.append([
+    buttons = [
+        [
             InlineKeyboardButton(
                 f"{key}. {error_type}", 
                 callback_data=f"{PREFIX_REPORT_TYPE}{bot_name}_{key}"
             )
-        ])
+        ]
+        for key, error_type in ERROR_TYPES.items()
+    ]
     
     # Add cancel button
     buttons.append([
@@ -610,25 +836,31 @@ async def handle_report_error(_, callback_query: CallbackQuery):
         )
     ])
     
-    await callback_query.edit_message_text(
+    return InlineKeyboardMarkup(buttons)
+
+
+async def handle_report_error(_, callback_query: CallbackQuery):
+    """Callback handler for error reporting."""
+    bot_name = callback_query.data[len(PREFIX_REPORT):]
+    
+    await safe_edit(
+        callback_query,
         f"⚠️ Report an issue with {bot_name}\n\n"
         "Please select the type of issue:",
-        reply_markup=InlineKeyboardMarkup(buttons),
+        reply_markup=build_report_keyboard(bot_name),
         parse_mode=ParseMode.MARKDOWN
     )
     await callback_query.answer()
 
 
-@bot.on_callback_query(filters.regex(f"^{PREFIX_REPORT_TYPE}"))
-@verify_callback_initiator
 async def handle_report_submission(_, callback_query: CallbackQuery):
     """Handle error report submission."""
     # Extract bot name and error type from callback data
-    data_parts = callback_query.data.replace(PREFIX_REPORT_TYPE, "").split("_")
-    if len(data_parts) != 2:
+    # Bot names may contain underscores; the error type id never does
+    bot_name, sep, error_type_id = callback_query.data[len(PREFIX_REPORT_TYPE):].rpartition("_")
+    if not sep:
         return await callback_query.answer("Invalid report data", show_alert=True)
     
-    bot_name, error_type_id = data_parts
     error_type = ERROR_TYPES.get(error_type_id, "Unknown issue")
     
     # Get bot configuration
@@ -653,10 +885,11 @@ async def handle_report_submission(_, callback_query: CallbackQuery):
             )
             await bot.send_message(LOG_CHANNEL, report_message)
         except Exception as e:
-            print(f"Failed to send error report: {e}")
+            logger.warning("Failed to send error report: %s", e, exc_info=True)
     
     # Notify the user that the report has been submitted
-    await callback_query.edit_message_text(
+    await safe_edit(
+        callback_query,
         f"✅ Your error report for {bot_name} has been submitted.\n"
         f"Error Type: {error_type}\n\n"
         "Thank you for helping us improve!",
@@ -666,4 +899,26 @@ async def handle_report_submission(_, callback_query: CallbackQuery):
         parse_mode=ParseMode.MARKDOWN
     )
     await callback_query.answer()
-      
\ No newline at end of file
+
+
+# Callback data prefixes and their handlers; one precompiled regex routes
+# every status callback so pyrogram runs a single filter for all of them
+CALLBACK_HANDLERS = {
+    STATUS_PREFIX: handle_status_commands,
+    PREFIX_PING: handle_bot_callback,
+    PREFIX_CLOSE: handle_bot_callback,
+    PREFIX_BACK: show_bots_menu,
+    PREFIX_CHECK: handle_bot_actions,
+    PREFIX_REDEPLOY: handle_bot_actions,
+    PREFIX_REPORT: handle_report_error,
+    PREFIX_REPORT_TYPE: handle_report_submission,
+}
+_CALLBACK_RE = re.compile(f"^({'|'.join(map(re.escape, CALLBACK_HANDLERS))})")
+
+
+@bot.on_callback_query(filters.regex(_CALLBACK_RE))
+@verify_callback_initiator
+async def handle_status_callback(_, callback_query: CallbackQuery):
+    """Dispatch a status callback to the handler of its prefix."""
+    prefix = callback_query.matches[0].group(1)
+    return await CALLBACK_HANDLERS[prefix](_, callback_query)